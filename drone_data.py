@@ -3,111 +3,174 @@ Drone Data Management Utilities
 Handles real-time drone data, fleet management, and mission tracking
 """
 
-import pandas as pd
 import numpy as np
+from collections import deque
 from datetime import datetime, timedelta
-import random
-import json
+from math import radians, cos, sin, asin, sqrt
+
+# Status vocabulary for the fleet's categorical status array
+DRONE_STATUSES = ['Active', 'Charging', 'Maintenance', 'Standby', 'Returning']
+STATUS_CODES = {status: code for code, status in enumerate(DRONE_STATUSES)}
+
+# Battery distribution buckets, lowest first; the open top edge keeps 100% in the last bucket
+BATTERY_BIN_EDGES = np.array([0, 20, 40, 60, 80, np.inf])
+BATTERY_BIN_LABELS = ['0-20%', '20-40%', '40-60%', '60-80%', '80-100%']
 
 class DroneDataManager:
     """Main class for managing drone fleet data and operations"""
 
-    def __init__(self):
+    def __init__(self, seed=None, debug=False):
         self.drone_count = 15
-        self.drones = self._initialize_fleet()
+        self.debug = debug
+        self._event_log = deque(maxlen=10000)
+        self._status_names = list(DRONE_STATUSES)
+        self._status_codes = dict(STATUS_CODES)
+        self._rng = np.random.default_rng(seed)
+        self._initialize_fleet()
+        self._dirty = True
+        self._overview_cache = None
+        self.version = 0  # Bumped on every fleet mutation
         self.mission_history = []
         self.last_update = datetime.now()
 
     def _initialize_fleet(self):
-        """Initialize the drone fleet with default values"""
-        drone_fleet = {}
-
-        for i in range(1, self.drone_count + 1):
-            drone_id = f"LLA-{i:03d}"
-
-            # Base coordinates (Delhi area for example)
-            base_lat, base_lon = 28.6139, 77.2090
-
-            # Generate status first
-            status = random.choice(['Active', 'Charging', 'Maintenance', 'Standby'])
-
-            drone_fleet[drone_id] = {
-                'id': drone_id,
-                'status': status,
-                'battery': random.randint(20, 100),
-                'location': {
-                    'lat': base_lat + random.uniform(-0.05, 0.05),
-                    'lon': base_lon + random.uniform(-0.05, 0.05),
-                    'altitude': random.uniform(0, 150),
-                    'zone': random.choice(['Zone Alpha', 'Zone Beta', 'Zone Gamma', 'Base Station'])
-                },
-                'mission': {
-                    'type': random.choice(['Medical Delivery', 'Search & Rescue', 'Supply Drop', 'Reconnaissance', 'Standby']),
-                    'destination': f'Station {chr(65 + random.randint(0, 4))}',
-                    'start_time': datetime.now() - timedelta(minutes=random.randint(0, 120)),
-                    'estimated_duration': random.randint(15, 60),
-                    'priority': random.choice(['Critical', 'High', 'Medium', 'Low'])
-                },
-                'technical': {
-                    'model': 'VTOL-MD-2024',
-                    'max_range': 25,  # km
-                    'max_payload': 5,  # kg
-                    'max_speed': 80,  # km/h
-                    'current_speed': random.uniform(0, 80) if status == 'Active' else 0,
-                    'flight_time_total': random.uniform(100, 800),  # hours
-                    'cycles_total': random.randint(500, 2000)
-                },
-                'last_update': datetime.now() - timedelta(minutes=random.randint(0, 5))
+        """Initialize the drone fleet with default values
+
+        Fleet state is stored struct-of-arrays style: one NumPy array per
+        numeric attribute, indexed by the drone's position in ``self._ids``.
+        """
+        n = self.drone_count
+        rng = self._rng
+        now = datetime.now()
+
+        # Base coordinates (Delhi area for example)
+        base_lat, base_lon = 28.6139, 77.2090
+
+        self._ids = np.array([f"LLA-{i:03d}" for i in range(1, n + 1)])
+        self._index = {drone_id: i for i, drone_id in enumerate(self._ids.tolist())}
+
+        self._status = rng.integers(0, 4, n).astype(np.uint8)  # Active/Charging/Maintenance/Standby
+        self._battery = rng.integers(20, 101, n).astype(np.float64)
+        self._lat = base_lat + rng.uniform(-0.05, 0.05, n)
+        self._lon = base_lon + rng.uniform(-0.05, 0.05, n)
+        self._altitude = rng.uniform(0, 150, n)
+        self._speed = np.where(self._status == STATUS_CODES['Active'], rng.uniform(0, 80, n), 0.0)
+        self._flight_time = rng.uniform(100, 800, n)  # hours
+        self._cycles = rng.integers(500, 2001, n)
+
+        # Non-numeric per-drone fields stay as plain Python lists
+        self._zones = rng.choice(['Zone Alpha', 'Zone Beta', 'Zone Gamma', 'Base Station'], n).tolist()
+        mission_types = rng.choice(['Medical Delivery', 'Search & Rescue', 'Supply Drop', 'Reconnaissance', 'Standby'], n).tolist()
+        stations = rng.integers(0, 5, n).tolist()
+        start_offsets = rng.integers(0, 121, n).tolist()
+        durations = rng.integers(15, 61, n).tolist()
+        priorities = rng.choice(['Critical', 'High', 'Medium', 'Low'], n).tolist()
+        self._missions = [
+            {
+                'type': mission_types[i],
+                'destination': f'Station {chr(65 + stations[i])}',
+                'start_time': now - timedelta(minutes=start_offsets[i]),
+                'estimated_duration': durations[i],
+                'priority': priorities[i]
             }
-
-        return drone_fleet
+            for i in range(n)
+        ]
+        self._last_update = [now - timedelta(minutes=m) for m in rng.integers(0, 6, n).tolist()]
+
+    def _status_code(self, status):
+        """Map a status name to its categorical code, registering unseen names"""
+        code = self._status_codes.get(status)
+        if code is None:
+            code = len(self._status_names)
+            self._status_names.append(status)
+            self._status_codes[status] = code
+        return code
+
+    def _get_status(self, i):
+        """Get the status name of the drone at index ``i``"""
+        return self._status_names[self._status[i]]
+
+    def _get_cached_overview(self):
+        """Get fleet reductions, recomputing only after the fleet has changed"""
+        if self._dirty:
+            counts = np.bincount(self._status, minlength=len(self._status_names))
+            self._overview_cache = {
+                'total': len(self._ids),
+                'active': int(counts[STATUS_CODES['Active']]),
+                'charging': int(counts[STATUS_CODES['Charging']]),
+                'maintenance': int(counts[STATUS_CODES['Maintenance']]),
+                'average_battery': float(self._battery.mean())
+            }
+            self._dirty = False
+        return self._overview_cache
 
     def get_fleet_overview(self):
         """Get high-level fleet statistics"""
-        active_count = len([d for d in self.drones.values() if d['status'] == 'Active'])
-        charging_count = len([d for d in self.drones.values() if d['status'] == 'Charging'])
-        maintenance_count = len([d for d in self.drones.values() if d['status'] == 'Maintenance'])
+        overview = self._get_cached_overview()
 
         return {
-            'total': len(self.drones),
-            'active': active_count,
-            'charging': charging_count,
-            'maintenance': maintenance_count,
-            'change': random.randint(-2, 5),  # Simulated change from previous period
-            'active_change': random.randint(-1, 3)
+            'total': overview['total'],
+            'active': overview['active'],
+            'charging': overview['charging'],
+            'maintenance': overview['maintenance'],
+            'change': int(self._rng.integers(-2, 6)),  # Simulated change from previous period
+            'active_change': int(self._rng.integers(-1, 4))
         }
 
     def get_detailed_fleet_status(self):
         """Get detailed status for all drones"""
-        fleet_status = []
+        statuses = [self._status_names[code] for code in self._status.tolist()]
+        missions = [mission['type'] for mission in self._missions]
 
-        for drone_id, drone in self.drones.items():
-            fleet_status.append({
-                'id': drone['id'],
-                'status': drone['status'],
-                'battery': drone['battery'],
-                'mission': drone['mission']['type'],
-                'location': drone['location']['zone'],
-                'lat': drone['location']['lat'],
-                'lon': drone['location']['lon'],
-                'altitude': drone['location']['altitude'],
-                'speed': drone['technical']['current_speed'],
-                'last_update': drone['last_update']
-            })
+        fleet_status = []
+        for row in zip(self._ids.tolist(), statuses, self._battery.tolist(), missions, self._zones,
+                       self._lat.tolist(), self._lon.tolist(), self._altitude.tolist(),
+                       self._speed.tolist(), self._last_update):
+            fleet_status.append(dict(zip(
+                ('id', 'status', 'battery', 'mission', 'location', 'lat', 'lon',
+                 'altitude', 'speed', 'last_update'),
+                row
+            )))
 
         return fleet_status
 
     def get_drone_details(self, drone_id):
         """Get detailed information for a specific drone"""
-        if drone_id in self.drones:
-            return self.drones[drone_id]
-        return None
+        i = self._index.get(drone_id)
+        if i is None:
+            return None
+
+        return {
+            'id': drone_id,
+            'status': self._get_status(i),
+            'battery': float(self._battery[i]),
+            'location': {
+                'lat': float(self._lat[i]),
+                'lon': float(self._lon[i]),
+                'altitude': float(self._altitude[i]),
+                'zone': self._zones[i]
+            },
+            'mission': self._missions[i],
+            'technical': {
+                'model': 'VTOL-MD-2024',
+                'max_range': 25,  # km
+                'max_payload': 5,  # kg
+                'max_speed': 80,  # km/h
+                'current_speed': float(self._speed[i]),
+                'flight_time_total': float(self._flight_time[i]),  # hours
+                'cycles_total': int(self._cycles[i])
+            },
+            'last_update': self._last_update[i]
+        }
 
     def update_drone_status(self, drone_id, new_status):
         """Update the status of a specific drone"""
-        if drone_id in self.drones:
-            self.drones[drone_id]['status'] = new_status
-            self.drones[drone_id]['last_update'] = datetime.now()
+        i = self._index.get(drone_id)
+        if i is not None:
+            self._status[i] = self._status_code(new_status)
+            self._last_update[i] = datetime.now()
+            self._dirty = True
+            self.version += 1
 
             # Log the status change
             self._log_status_change(drone_id, new_status)
@@ -116,73 +179,70 @@ class DroneDataManager:
 
     def simulate_real_time_data(self):
         """Simulate real-time updates to drone data"""
-        for drone_id, drone in self.drones.items():
-            # Simulate battery drain for active drones
-            if drone['status'] == 'Active':
-                battery_drain = random.uniform(0.5, 2.0)
-                drone['battery'] = max(0, drone['battery'] - battery_drain)
-
-                # Force return if battery too low
-                if drone['battery'] < 15:
-                    drone['status'] = 'Returning'
-                    drone['mission']['type'] = 'Return to Base'
-
-            # Simulate battery charging
-            elif drone['status'] == 'Charging':
-                charge_rate = random.uniform(1.0, 3.0)
-                drone['battery'] = min(100, drone['battery'] + charge_rate)
-
-                # Ready for deployment when fully charged
-                if drone['battery'] >= 95:
-                    drone['status'] = 'Standby'
-
-            # Update location for active drones
-            if drone['status'] in ['Active', 'Returning']:
-                # Simulate movement
-                lat_change = random.uniform(-0.001, 0.001)
-                lon_change = random.uniform(-0.001, 0.001)
-                drone['location']['lat'] += lat_change
-                drone['location']['lon'] += lon_change
-
-                # Update speed
-                drone['technical']['current_speed'] = random.uniform(30, 80)
-            else:
-                drone['technical']['current_speed'] = 0
-
-            # Update last update timestamp
-            drone['last_update'] = datetime.now()
+        rng = self._rng
+        now = datetime.now()
+
+        # Simulate battery drain for active drones
+        active = self._status == STATUS_CODES['Active']
+        self._battery[active] = np.maximum(0, self._battery[active] - rng.uniform(0.5, 2.0, active.sum()))
+
+        # Force return if battery too low
+        returning = active & (self._battery < 15)
+        self._status[returning] = STATUS_CODES['Returning']
+        for i in np.flatnonzero(returning).tolist():
+            self._missions[i]['type'] = 'Return to Base'
+
+        # Simulate battery charging
+        charging = self._status == STATUS_CODES['Charging']
+        self._battery[charging] = np.minimum(100, self._battery[charging] + rng.uniform(1.0, 3.0, charging.sum()))
+
+        # Ready for deployment when fully charged
+        self._status[charging & (self._battery >= 95)] = STATUS_CODES['Standby']
+
+        # Update location and speed for active drones
+        moving = (self._status == STATUS_CODES['Active']) | (self._status == STATUS_CODES['Returning'])
+        n_moving = moving.sum()
+        self._lat[moving] += rng.uniform(-0.001, 0.001, n_moving)
+        self._lon[moving] += rng.uniform(-0.001, 0.001, n_moving)
+        self._speed[moving] = rng.uniform(30, 80, n_moving)
+        self._speed[~moving] = 0
+
+        # Update last update timestamp
+        self._last_update = [now] * len(self._ids)
+        self._dirty = True
+        self.version += 1
 
     def get_mission_stats(self):
         """Get mission performance statistics"""
         # Simulate mission data
-        today_missions = random.randint(15, 35)
-        yesterday_missions = random.randint(10, 30)
+        today_missions = int(self._rng.integers(15, 36))
+        yesterday_missions = int(self._rng.integers(10, 31))
 
         return {
             'completed_today': today_missions,
             'change_percent': ((today_missions - yesterday_missions) / yesterday_missions) * 100,
-            'avg_delivery_time': random.uniform(8, 15),
-            'delivery_time_change': random.uniform(-2, 1),
-            'success_rate': random.uniform(92, 98)
+            'avg_delivery_time': float(self._rng.uniform(8, 15)),
+            'delivery_time_change': float(self._rng.uniform(-2, 1)),
+            'success_rate': float(self._rng.uniform(92, 98))
         }
 
     def get_success_rate(self):
         """Get current mission success rate"""
-        return random.uniform(92, 98)
+        return float(self._rng.uniform(92, 98))
 
     def get_delivery_trends(self):
         """Get delivery time trends over the past week"""
-        dates = pd.date_range(start=datetime.now() - timedelta(days=7), end=datetime.now(), freq='D')
+        import pandas as pd  # Deferred: only this report needs pandas
 
-        trend_data = []
-        for date in dates:
-            trend_data.append({
-                'date': date,
-                'avg_delivery_time': random.uniform(8, 16),
-                'missions_completed': random.randint(8, 25)
-            })
+        now = datetime.now()
+        dates = pd.date_range(start=now - timedelta(days=7), end=now, freq='D')
+        n = len(dates)
 
-        return pd.DataFrame(trend_data)
+        return pd.DataFrame({
+            'date': dates,
+            'avg_delivery_time': self._rng.uniform(8, 16, n),
+            'missions_completed': self._rng.integers(8, 26, n)
+        })
 
     def get_mission_distribution(self):
         """Get distribution of mission types"""
@@ -196,47 +256,31 @@ class DroneDataManager:
 
     def get_battery_distribution(self):
         """Get battery level distribution across fleet"""
-        battery_ranges = {
-            '80-100%': 0,
-            '60-80%': 0,
-            '40-60%': 0,
-            '20-40%': 0,
-            '0-20%': 0
-        }
+        counts, _ = np.histogram(self._battery, bins=BATTERY_BIN_EDGES)
 
-        for drone in self.drones.values():
-            battery = drone['battery']
-            if battery >= 80:
-                battery_ranges['80-100%'] += 1
-            elif battery >= 60:
-                battery_ranges['60-80%'] += 1
-            elif battery >= 40:
-                battery_ranges['40-60%'] += 1
-            elif battery >= 20:
-                battery_ranges['20-40%'] += 1
-            else:
-                battery_ranges['0-20%'] += 1
-
-        return battery_ranges
+        # Highest bucket first, matching the dashboard's display order
+        return dict(zip(reversed(BATTERY_BIN_LABELS), reversed(counts.tolist())))
 
     def get_average_battery(self):
         """Get average battery level across fleet"""
-        total_battery = sum(drone['battery'] for drone in self.drones.values())
-        return total_battery / len(self.drones)
+        return self._get_cached_overview()['average_battery']
 
     def deploy_drone(self, drone_id, mission_type, destination, priority='Medium'):
         """Deploy a drone on a new mission"""
-        if drone_id in self.drones and self.drones[drone_id]['status'] == 'Standby':
-            drone = self.drones[drone_id]
-            drone['status'] = 'Active'
-            drone['mission'] = {
+        i = self._index.get(drone_id)
+        if i is not None and self._get_status(i) == 'Standby':
+            now = datetime.now()
+            self._status[i] = STATUS_CODES['Active']
+            self._missions[i] = {
                 'type': mission_type,
                 'destination': destination,
-                'start_time': datetime.now(),
-                'estimated_duration': random.randint(15, 60),
+                'start_time': now,
+                'estimated_duration': int(self._rng.integers(15, 61)),
                 'priority': priority
             }
-            drone['last_update'] = datetime.now()
+            self._last_update[i] = now
+            self._dirty = True
+            self.version += 1
 
             self._log_mission_start(drone_id, mission_type, destination)
             return True
@@ -244,11 +288,13 @@ class DroneDataManager:
 
     def recall_drone(self, drone_id):
         """Recall a drone back to base"""
-        if drone_id in self.drones and self.drones[drone_id]['status'] == 'Active':
-            drone = self.drones[drone_id]
-            drone['status'] = 'Returning'
-            drone['mission']['type'] = 'Return to Base'
-            drone['last_update'] = datetime.now()
+        i = self._index.get(drone_id)
+        if i is not None and self._get_status(i) == 'Active':
+            self._status[i] = STATUS_CODES['Returning']
+            self._missions[i]['type'] = 'Return to Base'
+            self._last_update[i] = datetime.now()
+            self._dirty = True
+            self.version += 1
 
             self._log_status_change(drone_id, 'Returning')
             return True
@@ -263,7 +309,9 @@ class DroneDataManager:
             'new_status': new_status
         }
         # In a real implementation, this would write to a database
-        print(f"LOG: {drone_id} status changed to {new_status}")
+        self._event_log.append(log_entry)
+        if self.debug:
+            print(self._format_log_entry(log_entry))
 
     def _log_mission_start(self, drone_id, mission_type, destination):
         """Log mission start for tracking"""
@@ -275,20 +323,34 @@ class DroneDataManager:
             'destination': destination
         }
         self.mission_history.append(log_entry)
-        print(f"LOG: {drone_id} started {mission_type} mission to {destination}")
+        self._event_log.append(log_entry)
+        if self.debug:
+            print(self._format_log_entry(log_entry))
+
+    @staticmethod
+    def _format_log_entry(log_entry):
+        """Format an audit log entry as a printable line"""
+        if log_entry['event_type'] == 'mission_start':
+            return (f"LOG: {log_entry['drone_id']} started {log_entry['mission_type']} "
+                    f"mission to {log_entry['destination']}")
+        return f"LOG: {log_entry['drone_id']} status changed to {log_entry['new_status']}"
+
+    def flush_logs(self):
+        """Print and clear buffered audit log entries, returning them"""
+        entries = list(self._event_log)
+        self._event_log.clear()
+        for log_entry in entries:
+            print(self._format_log_entry(log_entry))
+        return entries
 
     def get_flight_hours_total(self):
         """Get total flight hours across all drones"""
-        return sum(drone['technical']['flight_time_total'] for drone in self.drones.values())
+        return float(self._flight_time.sum())
 
     def get_emergency_drones(self):
         """Get list of drones available for emergency deployment"""
-        emergency_ready = []
-        for drone_id, drone in self.drones.items():
-            if (drone['status'] == 'Standby' and 
-                drone['battery'] > 80):
-                emergency_ready.append(drone_id)
-        return emergency_ready
+        ready = (self._status == STATUS_CODES['Standby']) & (self._battery > 80)
+        return self._ids[ready].tolist()
 
 # Helper functions for coordinates and mapping
 def get_drone_coordinates(drone_id):
@@ -302,12 +364,10 @@ def get_drone_coordinates(drone_id):
 
     return lat, lon
 
-def calculate_distance(lat1, lon1, lat2, lon2):
-    """Calculate distance between two GPS coordinates"""
-    from math import radians, cos, sin, asin, sqrt
-
+def _haversine_py(lat1, lon1, lat2, lon2):
+    """Haversine distance in kilometers between two scalar GPS coordinates"""
     # Convert to radians
-    lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
+    lat1, lon1, lat2, lon2 = radians(lat1), radians(lon1), radians(lat2), radians(lon2)
 
     # Haversine formula
     dlat = lat2 - lat1
@@ -318,6 +378,38 @@ def calculate_distance(lat1, lon1, lat2, lon2):
 
     return c * r
 
+def _haversine(lat1, lon1, lat2, lon2):
+    """Compile the kernel on first use, then replace this stub with it"""
+    global _haversine
+    try:
+        from numba import njit  # Deferred: importing Numba costs more than the rest of the module
+    except ImportError:  # Numba is optional; fall back to plain Python math
+        _haversine = _haversine_py
+    else:
+        _haversine = njit(cache=True, fastmath=True)(_haversine_py)
+    return _haversine(lat1, lon1, lat2, lon2)
+
+def calculate_distance(lat1, lon1, lat2, lon2):
+    """Calculate distance between two GPS coordinates"""
+    return _haversine(lat1, lon1, lat2, lon2)
+
+def calculate_distances(lat1, lon1, lat2, lon2):
+    """Calculate distances between GPS coordinates, element-wise over arrays
+
+    Accepts scalars or array-likes that broadcast together, e.g. one origin
+    against arrays of destinations, and returns distances in kilometers.
+    """
+    lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+
+    # Haversine formula
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    c = 2 * np.arcsin(np.sqrt(a))
+    r = 6371  # Radius of earth in kilometers
+
+    return c * r
+
 def estimate_flight_time(distance_km, speed_kmh=60):
     """Estimate flight time based on distance and speed"""
     return (distance_km / speed_kmh) * 60  # Return in minutes
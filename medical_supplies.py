@@ -6,16 +6,37 @@ Handles inventory tracking, delivery management, and supply chain operations
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-import random
-import json
+from numbers import Integral, Real
+
+# Item-name tokens that drive storage temperature and priority classification
+REFRIGERATED_TOKENS = frozenset({'Blood', 'Vaccine', 'Plasma'})
+FROZEN_TOKENS = frozenset({'Frozen', 'Anti-Venom'})
+CRITICAL_TOKENS = frozenset({'blood', 'epinephrine', 'norepinephrine', 'trauma', 'emergency'})
+HIGH_PRIORITY_TOKENS = frozenset({'vaccine', 'antitoxin', 'surgical'})
+
+def _whole_quantity(quantity):
+    """Return ``quantity`` as an int, or None if it is not a whole number of units"""
+    if isinstance(quantity, bool) or not isinstance(quantity, Real):
+        return None
+    if isinstance(quantity, Integral):
+        return int(quantity)
+    return int(quantity) if float(quantity).is_integer() else None
 
 class MedicalSupplyManager:
     """Main class for managing medical supply inventory and deliveries"""
 
-    def __init__(self):
+    def __init__(self, seed=None):
+        self._rng = np.random.default_rng(seed)
         self.inventory = self._initialize_inventory()
-        self.active_deliveries = []
+        self._item_positions = {item_id: pos for pos, item_id in enumerate(self.inventory['item_id'])}
+        self._name_lower = self.inventory['item_name'].str.lower()
+        self._category_lower = self.inventory['category'].astype(str).str.lower()
+        self._refresh_expiry_days()
+        self.version = 0  # Bumped on every inventory mutation
+        self._active_deliveries = {}
         self.delivery_history = []
+        self._history_columns = {'created': [], 'actual': [], 'estimated': [], 'delivered': []}
+        self._history_arrays = None
         self.temperature_monitors = {}
 
     def _initialize_inventory(self):
@@ -61,67 +82,89 @@ class MedicalSupplyManager:
         }
 
         inventory_data = []
-        item_id_counter = 1
-
-        for category, items in medical_categories.items():
-            for item in items:
-                # Determine temperature requirements based on item type
-                if 'Blood' in item or 'Vaccine' in item or 'Plasma' in item:
-                    temp_req = '2-8°C'
-                elif 'Frozen' in item or 'Anti-Venom' in item:
-                    temp_req = '-20°C'
-                else:
-                    temp_req = 'Room Temp'
-
-                # Set priority based on item criticality
-                if any(word in item.lower() for word in ['blood', 'epinephrine', 'trauma', 'emergency']):
-                    priority = 'Critical'
-                elif any(word in item.lower() for word in ['vaccine', 'antitoxin', 'surgical']):
-                    priority = 'High'
-                else:
-                    priority = random.choice(['Medium', 'Low'])
-
-                inventory_data.append({
-                    'item_id': f"MED-{item_id_counter:04d}",
-                    'category': category,
-                    'item_name': item,
-                    'current_stock': random.randint(5, 150),
-                    'min_stock_level': random.randint(10, 30),
-                    'max_stock_level': random.randint(100, 200),
-                    'unit_of_measure': random.choice(['units', 'vials', 'packs', 'doses', 'kits']),
-                    'temperature_requirement': temp_req,
-                    'expiry_date': datetime.now() + timedelta(days=random.randint(30, 1095)),
-                    'batch_number': f"BT{random.randint(10000, 99999)}",
-                    'supplier': random.choice(['MedSupply Corp', 'HealthTech Ltd', 'BioMed Solutions', 'PharmaCare Inc']),
-                    'unit_cost': random.uniform(5, 500),
-                    'location': f"Cold Storage {random.choice(['A', 'B', 'C'])}" if temp_req != 'Room Temp' else f"Storage Unit {random.choice(['D', 'E', 'F'])}",
-                    'priority': priority,
-                    'last_restocked': datetime.now() - timedelta(days=random.randint(1, 60)),
-                    'reserved_stock': random.randint(0, 10),
-                    'quality_status': random.choice(['Good', 'Good', 'Good', 'Warning'])  # 75% good quality
-                })
-
-                item_id_counter += 1
-
-        return pd.DataFrame(inventory_data)
+        now = datetime.now()
+
+        # Build IDs and batch numbers for the whole catalog up front
+        catalog = [(category, item) for category, items in medical_categories.items() for item in items]
+        item_ids = [f"MED-{i:04d}" for i in range(1, len(catalog) + 1)]
+        batch_numbers = np.char.add('BT', self._rng.integers(10000, 100000, len(catalog)).astype('U5')).tolist()
+
+        for item_id, batch_number, (category, item) in zip(item_ids, batch_numbers, catalog):
+            tokens = frozenset(item.split())
+            lower_tokens = frozenset(item.lower().split())
+
+            # Determine temperature requirements based on item type
+            if tokens & REFRIGERATED_TOKENS:
+                temp_req = '2-8°C'
+            elif tokens & FROZEN_TOKENS:
+                temp_req = '-20°C'
+            else:
+                temp_req = 'Room Temp'
+
+            # Set priority based on item criticality
+            if lower_tokens & CRITICAL_TOKENS:
+                priority = 'Critical'
+            elif lower_tokens & HIGH_PRIORITY_TOKENS:
+                priority = 'High'
+            else:
+                priority = str(self._rng.choice(['Medium', 'Low']))
+
+            inventory_data.append({
+                'item_id': item_id,
+                'category': category,
+                'item_name': item,
+                'current_stock': int(self._rng.integers(5, 151)),
+                'min_stock_level': int(self._rng.integers(10, 31)),
+                'max_stock_level': int(self._rng.integers(100, 201)),
+                'unit_of_measure': str(self._rng.choice(['units', 'vials', 'packs', 'doses', 'kits'])),
+                'temperature_requirement': temp_req,
+                'expiry_date': now + timedelta(days=int(self._rng.integers(30, 1096))),
+                'batch_number': batch_number,
+                'supplier': str(self._rng.choice(['MedSupply Corp', 'HealthTech Ltd', 'BioMed Solutions', 'PharmaCare Inc'])),
+                'unit_cost': float(self._rng.uniform(5, 500)),
+                'location': f"Cold Storage {self._rng.choice(['A', 'B', 'C'])}" if temp_req != 'Room Temp' else f"Storage Unit {self._rng.choice(['D', 'E', 'F'])}",
+                'priority': priority,
+                'last_restocked': now - timedelta(days=int(self._rng.integers(1, 61))),
+                'reserved_stock': int(self._rng.integers(0, 11)),
+                'quality_status': str(self._rng.choice(['Good', 'Good', 'Good', 'Warning']))  # 75% good quality
+            })
+
+        inventory = pd.DataFrame(inventory_data)
+
+        # Low-cardinality text columns as categoricals, numeric columns downcast
+        for column in ['category', 'supplier', 'priority', 'temperature_requirement',
+                       'location', 'unit_of_measure', 'quality_status']:
+            inventory[column] = inventory[column].astype('category')
+
+        for column in ['current_stock', 'min_stock_level', 'max_stock_level', 'reserved_stock']:
+            inventory[column] = inventory[column].astype(np.int32)
+        inventory['unit_cost'] = inventory['unit_cost'].astype(np.float32)
+
+        return inventory
+
+    def _refresh_expiry_days(self):
+        """Cache inventory expiry dates as integer days since the epoch"""
+        self._expiry_days = self.inventory['expiry_date'].to_numpy().astype('datetime64[D]').astype(np.int32)
 
     def get_inventory_overview(self):
         """Get high-level inventory statistics"""
         total_items = len(self.inventory)
+        current_stock = self.inventory['current_stock'].to_numpy()
+        min_stock_level = self.inventory['min_stock_level'].to_numpy()
 
         # Calculate availability percentage
-        available_items = len(self.inventory[self.inventory['current_stock'] > self.inventory['min_stock_level']])
+        available_items = int((current_stock > min_stock_level).sum())
         availability_percent = (available_items / total_items) * 100
 
         # Critical stock items
-        critical_stock = len(self.inventory[self.inventory['current_stock'] <= self.inventory['min_stock_level']])
+        critical_stock = total_items - available_items
 
         return {
             'total_items': total_items,
             'availability': availability_percent,
             'critical_stock': critical_stock,
-            'change': random.uniform(-5, 10),  # Simulated change
-            'total_value': (self.inventory['current_stock'] * self.inventory['unit_cost']).sum()
+            'change': float(self._rng.uniform(-5, 10)),  # Simulated change
+            'total_value': float(np.dot(current_stock, self.inventory['unit_cost'].to_numpy()))
         }
 
     def get_critical_alerts(self):
@@ -130,39 +173,40 @@ class MedicalSupplyManager:
 
         # Low stock alerts
         low_stock = self.inventory[self.inventory['current_stock'] <= self.inventory['min_stock_level']]
-        for _, item in low_stock.iterrows():
-            alerts.append({
-                'type': 'Low Stock',
-                'severity': 'Critical' if item['current_stock'] < item['min_stock_level'] * 0.5 else 'Warning',
-                'item': item['item_name'],
-                'current_stock': item['current_stock'],
-                'min_required': item['min_stock_level'],
-                'category': item['category']
-            })
+        current_stock = low_stock['current_stock'].to_numpy()
+        min_stock_level = low_stock['min_stock_level'].to_numpy()
+        alerts.extend(pd.DataFrame({
+            'type': 'Low Stock',
+            'severity': np.where(current_stock < min_stock_level * 0.5, 'Critical', 'Warning'),
+            'item': low_stock['item_name'].to_numpy(),
+            'current_stock': current_stock,
+            'min_required': min_stock_level,
+            'category': low_stock['category'].to_numpy()
+        }).to_dict('records'))
 
         # Expiring items (within 30 days)
-        expiring_soon = self.inventory[
-            (self.inventory['expiry_date'] - datetime.now()).dt.days <= 30
-        ]
-        for _, item in expiring_soon.iterrows():
-            days_to_expiry = (item['expiry_date'] - datetime.now()).days
-            alerts.append({
-                'type': 'Expiring Soon',
-                'severity': 'Critical' if days_to_expiry <= 7 else 'Warning',
-                'item': item['item_name'],
-                'days_remaining': days_to_expiry,
-                'batch_number': item['batch_number'],
-                'quantity': item['current_stock']
-            })
+        today = np.datetime64(datetime.now().date(), 'D').astype(np.int32)
+        days_remaining = self._expiry_days - today
+        expiring_idx = np.flatnonzero(days_remaining <= 30)
+        expiring_soon = self.inventory.iloc[expiring_idx]
+        days_to_expiry = days_remaining[expiring_idx]
+        alerts.extend(pd.DataFrame({
+            'type': 'Expiring Soon',
+            'severity': np.where(days_to_expiry <= 7, 'Critical', 'Warning'),
+            'item': expiring_soon['item_name'].to_numpy(),
+            'days_remaining': days_to_expiry,
+            'batch_number': expiring_soon['batch_number'].to_numpy(),
+            'quantity': expiring_soon['current_stock'].to_numpy()
+        }).to_dict('records'))
 
         # Temperature alerts (simulated)
-        temp_alerts = random.randint(0, 2)
+        temp_alerts = int(self._rng.integers(0, 3))
         for i in range(temp_alerts):
             alerts.append({
                 'type': 'Temperature Alert',
                 'severity': 'Warning',
                 'item': 'Cold Storage Unit',
-                'message': f"Temperature fluctuation detected in {random.choice(['Storage A', 'Storage B', 'Storage C'])}"
+                'message': f"Temperature fluctuation detected in {self._rng.choice(['Storage A', 'Storage B', 'Storage C'])}"
             })
 
         return alerts
@@ -170,12 +214,17 @@ class MedicalSupplyManager:
     def create_delivery_order(self, item_id, quantity, destination, priority='Medium', drone_id=None):
         """Create a new delivery order"""
 
+        # Stock is counted in whole units; reject fractional quantities rather than truncate them
+        quantity = _whole_quantity(quantity)
+        if quantity is None:
+            return None
+
         # Find the item in inventory
-        item_row = self.inventory[self.inventory['item_id'] == item_id]
-        if item_row.empty:
+        pos = self._item_positions.get(item_id)
+        if pos is None:
             return None
 
-        item = item_row.iloc[0]
+        item = self.inventory.iloc[pos]
 
         # Check if sufficient stock available
         available_stock = item['current_stock'] - item['reserved_stock']
@@ -183,7 +232,8 @@ class MedicalSupplyManager:
             return None
 
         # Create delivery order
-        delivery_id = f"DEL-{len(self.active_deliveries) + len(self.delivery_history) + 1:06d}"
+        now = datetime.now()
+        delivery_id = f"DEL-{len(self._active_deliveries) + len(self.delivery_history) + 1:06d}"
 
         delivery_order = {
             'delivery_id': delivery_id,
@@ -196,8 +246,8 @@ class MedicalSupplyManager:
             'priority': priority,
             'drone_id': drone_id,
             'status': 'Pending' if drone_id is None else 'Assigned',
-            'created_time': datetime.now(),
-            'estimated_delivery_time': datetime.now() + timedelta(minutes=random.randint(15, 45)),
+            'created_time': now,
+            'estimated_delivery_time': now + timedelta(minutes=int(self._rng.integers(15, 46))),
             'temperature_requirement': item['temperature_requirement'],
             'special_handling': self._get_special_handling_requirements(item),
             'batch_number': item['batch_number'],
@@ -206,44 +256,44 @@ class MedicalSupplyManager:
         }
 
         # Reserve the stock
-        self.inventory.loc[self.inventory['item_id'] == item_id, 'reserved_stock'] += quantity
+        self._adjust_item_value(pos, 'reserved_stock', quantity)
 
         # Add to active deliveries
-        self.active_deliveries.append(delivery_order)
+        self._active_deliveries[delivery_id] = delivery_order
 
         return delivery_order
 
     def update_delivery_status(self, delivery_id, new_status, location=None, temperature=None):
         """Update the status of a delivery"""
 
-        for delivery in self.active_deliveries:
-            if delivery['delivery_id'] == delivery_id:
-                delivery['status'] = new_status
-
-                # Add chain of custody entry
-                custody_entry = {
-                    'timestamp': datetime.now(),
-                    'status': new_status,
-                    'location': location,
-                    'temperature': temperature
-                }
-                delivery['chain_of_custody'].append(custody_entry)
-
-                # If delivery completed, move to history and update inventory
-                if new_status == 'Delivered':
-                    self._complete_delivery(delivery)
-                    # Ensure status is set before moving to history
-                    delivery['status'] = 'Delivered'
-                    self.active_deliveries.remove(delivery)
-                    self.delivery_history.append(delivery)
-
-                return True
+        delivery = self._active_deliveries.get(delivery_id)
+        if delivery is None:
+            return False
 
-        return False
+        delivery['status'] = new_status
+
+        # Add chain of custody entry
+        custody_entry = {
+            'timestamp': datetime.now(),
+            'status': new_status,
+            'location': location,
+            'temperature': temperature
+        }
+        delivery['chain_of_custody'].append(custody_entry)
+
+        # If delivery completed, move to history and update inventory
+        if new_status == 'Delivered':
+            self._complete_delivery(delivery)
+            # Ensure status is set before moving to history
+            delivery['status'] = 'Delivered'
+            del self._active_deliveries[delivery_id]
+            self._add_to_history(delivery)
+
+        return True
 
     def get_active_deliveries(self):
         """Get list of all active deliveries"""
-        return self.active_deliveries
+        return list(self._active_deliveries.values())
 
     def get_delivery_history(self, days=7):
         """Get delivery history for specified number of days"""
@@ -261,15 +311,15 @@ class MedicalSupplyManager:
         alerts = []
 
         # Simulate temperature monitoring
-        for delivery in self.active_deliveries:
+        for delivery in self._active_deliveries.values():
             if delivery['temperature_requirement'] != 'Room Temp':
                 # Simulate temperature readings
-                if random.random() < 0.1:  # 10% chance of temperature alert
+                if self._rng.random() < 0.1:  # 10% chance of temperature alert
                     alerts.append({
                         'delivery_id': delivery['delivery_id'],
                         'item_name': delivery['item_name'],
                         'required_temp': delivery['temperature_requirement'],
-                        'current_temp': f"{random.uniform(-2, 12):.1f}°C",
+                        'current_temp': f"{self._rng.uniform(-2, 12):.1f}°C",
                         'alert_type': 'Temperature Deviation',
                         'severity': 'Warning'
                     })
@@ -278,7 +328,7 @@ class MedicalSupplyManager:
 
     def get_inventory_by_category(self):
         """Get inventory summary by category"""
-        category_summary = self.inventory.groupby('category').agg({
+        category_summary = self.inventory.groupby('category', observed=True).agg({
             'current_stock': 'sum',
             'unit_cost': lambda x: (self.inventory.loc[x.index, 'current_stock'] * x).sum(),
             'item_id': 'count'
@@ -289,40 +339,56 @@ class MedicalSupplyManager:
 
     def search_inventory(self, search_term):
         """Search inventory by item name or category"""
+        term = search_term.lower()
         mask = (
-            self.inventory['item_name'].str.contains(search_term, case=False, na=False) |
-            self.inventory['category'].str.contains(search_term, case=False, na=False)
+            self._name_lower.str.contains(term, regex=False, na=False) |
+            self._category_lower.str.contains(term, regex=False, na=False)
         )
         return self.inventory[mask]
 
     def _get_special_handling_requirements(self, item):
         """Determine special handling requirements for an item"""
         special_handling = []
+        tokens = frozenset(item['item_name'].split())
 
         if item['temperature_requirement'] != 'Room Temp':
             special_handling.append('Temperature Controlled')
 
-        if 'Blood' in item['item_name']:
+        if 'Blood' in tokens:
             special_handling.append('Biohazard')
             special_handling.append('Urgent Delivery')
 
         if item['priority'] == 'Critical':
             special_handling.append('Priority Handling')
 
-        if 'Vaccine' in item['item_name']:
+        if 'Vaccine' in tokens:
             special_handling.append('Cold Chain Required')
 
         return special_handling
 
+    def _set_item_value(self, pos, column, value):
+        """Set a single inventory cell by row position"""
+        self.inventory.iat[pos, self.inventory.columns.get_loc(column)] = value
+        self.version += 1
+
+    def _adjust_item_value(self, pos, column, delta):
+        """Add ``delta`` to an integer inventory cell without wrapping around"""
+        # Python int math cannot overflow; widen the column if the result no longer fits
+        value = int(self.inventory[column].iat[pos]) + delta
+        limits = np.iinfo(self.inventory[column].dtype)
+        if not limits.min <= value <= limits.max:
+            self.inventory[column] = self.inventory[column].astype(np.int64)
+        self._set_item_value(pos, column, value)
+
     def _complete_delivery(self, delivery):
         """Complete a delivery and update inventory"""
         # Reduce reserved stock and actual stock
         item_id = delivery['item_id']
         quantity = delivery['quantity']
 
-        mask = self.inventory['item_id'] == item_id
-        self.inventory.loc[mask, 'reserved_stock'] -= quantity
-        self.inventory.loc[mask, 'current_stock'] -= quantity
+        pos = self._item_positions[item_id]
+        self._adjust_item_value(pos, 'reserved_stock', -quantity)
+        self._adjust_item_value(pos, 'current_stock', -quantity)
 
         # Add completion timestamp
         delivery['completed_time'] = datetime.now()
@@ -330,63 +396,75 @@ class MedicalSupplyManager:
 
     def restock_item(self, item_id, quantity, batch_number=None, expiry_date=None):
         """Restock an inventory item"""
-        mask = self.inventory['item_id'] == item_id
+        quantity = _whole_quantity(quantity)
+        pos = self._item_positions.get(item_id)
 
-        if not self.inventory[mask].empty:
-            self.inventory.loc[mask, 'current_stock'] += quantity
-            self.inventory.loc[mask, 'last_restocked'] = datetime.now()
+        if pos is not None and quantity is not None:
+            self._adjust_item_value(pos, 'current_stock', quantity)
+            self._set_item_value(pos, 'last_restocked', datetime.now())
 
             if batch_number:
-                self.inventory.loc[mask, 'batch_number'] = batch_number
+                self._set_item_value(pos, 'batch_number', batch_number)
 
             if expiry_date:
-                self.inventory.loc[mask, 'expiry_date'] = expiry_date
+                self._set_item_value(pos, 'expiry_date', expiry_date)
+                self._refresh_expiry_days()
 
             return True
 
         return False
 
+    def _add_to_history(self, delivery):
+        """Append a finished delivery to the history and its columnar view"""
+        self.delivery_history.append(delivery)
+        self._history_columns['created'].append(delivery['created_time'])
+        self._history_columns['actual'].append(delivery.get('actual_delivery_time'))
+        self._history_columns['estimated'].append(delivery['estimated_delivery_time'])
+        self._history_columns['delivered'].append(delivery['status'] == 'Delivered')
+
+    def _get_history_arrays(self):
+        """Get delivery history columns as NumPy arrays, converting lazily"""
+        if self._history_arrays is None or len(self._history_arrays['created']) != len(self.delivery_history):
+            self._history_arrays = {
+                'created': np.array(self._history_columns['created'], dtype='datetime64[us]'),
+                'actual': np.array(self._history_columns['actual'], dtype='datetime64[us]'),
+                'estimated': np.array(self._history_columns['estimated'], dtype='datetime64[us]'),
+                'delivered': np.array(self._history_columns['delivered'], dtype=bool)
+            }
+        return self._history_arrays
+
     def get_supply_chain_metrics(self):
         """Get supply chain performance metrics"""
+        history = self._get_history_arrays()
+        delivered = history['delivered']
 
         # Calculate delivery performance
-        if self.delivery_history:
-            completed_deliveries = [d for d in self.delivery_history if d['status'] == 'Delivered']
-
-            if completed_deliveries:
-                # Average delivery time
-                avg_delivery_time = np.mean([
-                    (d['actual_delivery_time'] - d['created_time']).total_seconds() / 60
-                    for d in completed_deliveries
-                ])
-
-                # On-time delivery rate
-                on_time_deliveries = sum(
-                    1 for d in completed_deliveries
-                    if d['actual_delivery_time'] <= d['estimated_delivery_time']
-                )
-                on_time_rate = (on_time_deliveries / len(completed_deliveries)) * 100
-            else:
-                avg_delivery_time = 0
-                on_time_rate = 0
+        if delivered.any():
+            created = history['created'][delivered]
+            actual = history['actual'][delivered]
+
+            # Average delivery time
+            avg_delivery_time = (actual - created).astype(np.int64).mean() / 60e6
+
+            # On-time delivery rate
+            on_time_deliveries = (actual <= history['estimated'][delivered]).sum()
+            on_time_rate = (on_time_deliveries / len(created)) * 100
         else:
             avg_delivery_time = 0
             on_time_rate = 0
 
+        now = np.datetime64(datetime.now(), 'us')
         return {
-            'avg_delivery_time_minutes': avg_delivery_time,
-            'on_time_delivery_rate': on_time_rate,
-            'active_deliveries': len(self.active_deliveries),
-            'completed_deliveries_7d': len([
-                d for d in self.delivery_history
-                if (datetime.now() - d['created_time']).days <= 7
-            ])
+            'avg_delivery_time_minutes': float(avg_delivery_time),
+            'on_time_delivery_rate': float(on_time_rate),
+            'active_deliveries': len(self._active_deliveries),
+            'completed_deliveries_7d': int(((now - history['created']) < np.timedelta64(8, 'D')).sum())
         }
 
 # Helper functions
 def calculate_storage_requirements(inventory_df):
     """Calculate storage space requirements by temperature"""
-    storage_req = inventory_df.groupby('temperature_requirement').agg({
+    storage_req = inventory_df.groupby('temperature_requirement', observed=True).agg({
         'current_stock': 'sum',
         'item_name': 'count'
     })
@@ -394,20 +472,28 @@ def calculate_storage_requirements(inventory_df):
 
 def generate_supply_forecast(inventory_df, days=30):
     """Generate supply requirement forecast"""
-    forecast = {}
+    current_stock = inventory_df['current_stock'].to_numpy()
 
-    for _, item in inventory_df.iterrows():
-        # Simple forecast based on current consumption rate
-        daily_usage = random.uniform(0.5, 3.0)  # Simulated daily usage
-        days_remaining = item['current_stock'] / daily_usage
-
-        if days_remaining < days:
-            shortage_date = datetime.now() + timedelta(days=days_remaining)
-            forecast[item['item_name']] = {
-                'current_stock': item['current_stock'],
-                'daily_usage': daily_usage,
-                'shortage_date': shortage_date,
-                'recommended_reorder': item['max_stock_level'] - item['current_stock']
-            }
+    # Simple forecast based on current consumption rate
+    daily_usage = np.random.default_rng().uniform(0.5, 3.0, len(inventory_df))  # Simulated daily usage
+    days_remaining = current_stock / daily_usage
+    short = days_remaining < days
+
+    shortage_dates = (
+        np.datetime64(datetime.now(), 'us') +
+        (days_remaining[short] * 86400e6).astype('timedelta64[us]')
+    )
+    recommended_reorder = inventory_df['max_stock_level'].to_numpy()[short].astype(np.int64) - current_stock[short]
+
+    forecast = {}
+    for name, stock, usage, shortage_date, reorder in zip(
+            inventory_df['item_name'].to_numpy()[short].tolist(), current_stock[short].tolist(),
+            daily_usage[short].tolist(), shortage_dates.tolist(), recommended_reorder.tolist()):
+        forecast[name] = {
+            'current_stock': stock,
+            'daily_usage': usage,
+            'shortage_date': shortage_date,
+            'recommended_reorder': reorder
+        }
 
     return forecast
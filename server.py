@@ -3,9 +3,9 @@ Flask Server for VTOL Medical Drone System
 Replaces Streamlit with a local Flask server
 """
 
-from flask import Flask, jsonify, request, send_from_directory
-from flask_cors import CORS
-import json
+from flask import Flask, Response, jsonify, request
+from flask.json.provider import DefaultJSONProvider
+from flask_compress import Compress
 import os
 from datetime import datetime
 import random
@@ -17,9 +17,48 @@ from drone_data import DroneDataManager
 from medical_supplies import MedicalSupplyManager
 from utils.alerts import AlertManager
 from utils.authentication import authenticate_user
+from utils import fastjson
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that encodes responses with orjson"""
+
+    def dumps(self, obj, **kwargs):
+        return fastjson.dumps(obj, default=kwargs.get('default'), indent=kwargs.get('indent'),
+                              sort_keys=kwargs.get('sort_keys', False))
+
+    def loads(self, s, **kwargs):
+        return fastjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(fastjson.dumps_bytes(obj), mimetype=self.mimetype)
+
+# Frontend assets are served by Flask's static route, which sends ETag/Last-Modified and answers 304s
+app = Flask(__name__, static_folder='.', static_url_path='')
+app.json = OrjsonProvider(app)
+
+# Row-oriented JSON repeats the same keys per record and compresses 5-15x
+app.config.update(
+    COMPRESS_MIMETYPES=['application/json', 'text/html', 'text/css', 'application/javascript', 'text/javascript'],
+    COMPRESS_LEVEL=4,  # gzip level; low enough to stay cheap on every poll
+    COMPRESS_BR_LEVEL=4,
+    COMPRESS_STREAMS=True,  # Also compress the streamed list endpoints
+    COMPRESS_STREAMING_ENDPOINT_CONDITIONAL=['static', 'serve_index']  # Keep file 304s working
+)
+Compress(app)
+
+# CORS for frontend communication; the dashboard's origin is fixed, so the headers are too
+_CORS_HEADERS = {
+    'Access-Control-Allow-Origin': 'http://localhost:8080',
+    'Access-Control-Allow-Methods': 'GET, POST, PUT, OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type'
+}
 
-app = Flask(__name__)
-CORS(app)  # Enable CORS for frontend communication
+@app.after_request
+def add_cors_headers(response):
+    """Attach the static CORS headers to every response"""
+    response.headers.update(_CORS_HEADERS)
+    return response
 
 # Initialize data managers
 drone_manager = DroneDataManager()
@@ -40,60 +79,158 @@ app_data = {
     'activities': []
 }
 
-def update_app_data():
-    """Update application data from managers"""
-    # Update drone fleet data
-    fleet_status = drone_manager.get_detailed_fleet_status()
-    app_data['drone_fleet'] = fleet_status
-    
-    # Update medical supplies data
-    inventory_df = medical_manager.inventory
-    app_data['medical_supplies'] = inventory_df.to_dict('records')
-    
-    # Update KPI data
+# Serialized snapshots, rebuilt only when the owning manager's version changes
+_inventory_cache = {'version': None, 'records': []}
+
+def _cached_records(cache, version, build):
+    """Return cached records, rebuilding them if the source version moved"""
+    if cache['version'] != version:
+        cache['records'] = build()
+        cache['version'] = version
+    return cache['records']
+
+# (source version, payload) per section, published as one tuple so ETag and body always agree
+_section_snapshots = {}
+_ETAG_EPOCH = format(int(time.time()), 'x')  # Keeps ETags from a previous run from matching
+
+# Static payloads, encoded once at import
+_HEALTH_BYTES = fastjson.dumps_bytes({
+    "Drone Fleet": "OK",
+    "GPS Tracking": "OK",
+    "Communication": "OK",
+    "Medical Inventory": "OK",
+    "Weather Service": "OK",
+    "Database": "OK"
+})
+_NOT_FOUND_BYTES = fastjson.dumps_bytes({'error': 'Endpoint not found'})
+_INTERNAL_ERROR_BYTES = fastjson.dumps_bytes({'error': 'Internal server error'})
+
+def _stream_array(rows):
+    """Encode a list as a JSON array one row at a time"""
+    dumps = fastjson.dumps_bytes
+    yield b'['
+    first = True
+    for row in rows:
+        yield (b'' if first else b',') + dumps(row)
+        first = False
+    yield b']'
+
+def _conditional_json(section, stream=False):
+    """Return a section of app_data as JSON, or 304 if the client's ETag is current"""
+    version, payload = _section_snapshots[section]
+    etag = f"{section}-{_ETAG_EPOCH}-{version}"
+    if request.if_none_match.contains_weak(etag):
+        response = app.response_class(status=304)
+    elif stream:
+        response = Response(_stream_array(payload), mimetype='application/json')
+    else:
+        response = jsonify(payload)
+    response.set_etag(etag, weak=True)
+    return response
+
+def _publish(section, version, payload):
+    """Store a section's payload in app_data together with the version it was built from"""
+    app_data[_SECTION_KEYS[section]] = payload
+    _section_snapshots[section] = (version, payload)
+
+# Refreshers read the source version before building the payload: a concurrent
+# change then yields an older ETag on newer data (one extra 200), never a stale 304
+
+def _refresh_fleet():
+    """Advance the drone simulation and update fleet data"""
+    drone_manager.simulate_real_time_data()
+    version = drone_manager.version
+    # Every tick restamps every drone, so fleet records are rebuilt on each refresh
+    _publish('fleet', version, drone_manager.get_detailed_fleet_status())
+
+def _refresh_kpis():
+    """Update KPI data"""
+    refresh_if_stale('fleet')
     fleet_overview = drone_manager.get_fleet_overview()
     mission_stats = drone_manager.get_mission_stats()
-    inventory_overview = medical_manager.get_inventory_overview()
-    
+
     app_data['kpi_data'] = {
         'total_drones': fleet_overview['total'],
         'active_missions': fleet_overview['active'],
         'success_rate': mission_stats['success_rate'],
         'avg_delivery_time': mission_stats['avg_delivery_time']
     }
-    
-    # Update alerts
-    app_data['alerts'] = alert_manager.get_active_alerts()
-    
-    # Update activities
-    app_data['activities'] = alert_manager.get_recent_activities()
-
-def simulate_real_time_updates():
-    """Simulate real-time data updates"""
-    while True:
-        # Update drone data
-        drone_manager.simulate_real_time_data()
-        
-        # Update application data
-        update_app_data()
-        
-        # Sleep for 5 seconds
-        time.sleep(5)
-
-# Start real-time simulation in background thread
-update_thread = threading.Thread(target=simulate_real_time_updates, daemon=True)
-update_thread.start()
+
+def _refresh_inventory():
+    """Update medical supplies data"""
+    version = medical_manager.version
+    _publish('inventory', version, _cached_records(
+        _inventory_cache, version, lambda: medical_manager.inventory.to_dict('records')
+    ))
+
+def _refresh_alerts():
+    """Update alerts"""
+    version = alert_manager.version
+    _publish('alerts', version, alert_manager.get_active_alerts())
+
+def _refresh_activities():
+    """Update activities"""
+    version = alert_manager.version
+    _publish('activities', version, alert_manager.get_recent_activities())
+
+# Data is refreshed on demand, per section, at most once every REFRESH_TTL seconds
+REFRESH_TTL = 5
+_section_refreshers = {
+    'fleet': _refresh_fleet,
+    'kpi': _refresh_kpis,
+    'inventory': _refresh_inventory,
+    'alerts': _refresh_alerts,
+    'activities': _refresh_activities
+}
+_SECTION_KEYS = {
+    'fleet': 'drone_fleet',
+    'kpi': 'kpi_data',
+    'inventory': 'medical_supplies',
+    'alerts': 'alerts',
+    'activities': 'activities'
+}
+_section_locks = {section: threading.Lock() for section in _section_refreshers}
+_section_refreshed_at = {}
+
+def refresh_if_stale(section, ttl=REFRESH_TTL):
+    """Refresh one section of app_data if it is older than ``ttl`` seconds"""
+    with _section_locks[section]:
+        refreshed_at = _section_refreshed_at.get(section)
+        now = time.monotonic()
+        if refreshed_at is None or now - refreshed_at >= ttl:
+            _section_refreshers[section]()
+            _section_refreshed_at[section] = now
+
+def update_app_data():
+    """Update application data from managers"""
+    for section in _section_refreshers:
+        refresh_if_stale(section, ttl=0)
 
 # Serve static files
+# Images are immutable for a year; CSS/JS keep unversioned names, so browsers revalidate them by ETag
+_IMAGE_CACHE_CONTROL = 'public, max-age=31536000'
+_ASSET_CACHE_CONTROL = 'public, no-cache'
+_STATIC_CACHE_CONTROL = {
+    '.png': _IMAGE_CACHE_CONTROL,
+    '.svg': _IMAGE_CACHE_CONTROL,
+    '.ico': _IMAGE_CACHE_CONTROL,
+    '.css': _ASSET_CACHE_CONTROL,
+    '.js': _ASSET_CACHE_CONTROL
+}
+
+@app.after_request
+def add_static_cache_headers(response):
+    """Set Cache-Control on static asset responses"""
+    if request.endpoint == 'static' and response.status_code in (200, 304):
+        cache_control = _STATIC_CACHE_CONTROL.get(os.path.splitext(request.path)[1])
+        if cache_control:
+            response.headers['Cache-Control'] = cache_control
+    return response
+
 @app.route('/')
 def serve_index():
     """Serve the main HTML file"""
-    return send_from_directory('.', 'index.html')
-
-@app.route('/<path:filename>')
-def serve_static(filename):
-    """Serve static files (CSS, JS, etc.)"""
-    return send_from_directory('.', filename)
+    return app.send_static_file('index.html')
 
 # API Endpoints
 
@@ -120,18 +257,21 @@ def login():
 @app.route('/api/dashboard/kpis')
 def get_kpis():
     """Get key performance indicators"""
+    refresh_if_stale('kpi')
     return jsonify(app_data['kpi_data'])
 
 @app.route('/api/fleet/overview')
 def get_fleet_overview():
     """Get fleet overview data"""
+    refresh_if_stale('fleet')
     fleet_overview = drone_manager.get_fleet_overview()
     return jsonify(fleet_overview)
 
 @app.route('/api/fleet/status')
 def get_fleet_status():
     """Get detailed fleet status"""
-    return jsonify(app_data['drone_fleet'])
+    refresh_if_stale('fleet')
+    return _conditional_json('fleet', stream=True)
 
 @app.route('/api/fleet/<drone_id>')
 def get_drone_details(drone_id):
@@ -201,7 +341,8 @@ def get_battery_distribution():
 @app.route('/api/medical/inventory')
 def get_medical_inventory():
     """Get medical inventory data"""
-    return jsonify(app_data['medical_supplies'])
+    refresh_if_stale('inventory')
+    return _conditional_json('inventory', stream=True)
 
 @app.route('/api/medical/inventory/overview')
 def get_medical_overview():
@@ -243,7 +384,8 @@ def create_delivery():
 @app.route('/api/alerts')
 def get_alerts():
     """Get active alerts"""
-    return jsonify(app_data['alerts'])
+    refresh_if_stale('alerts')
+    return _conditional_json('alerts')
 
 @app.route('/api/alerts/emergency', methods=['POST'])
 def create_emergency_alert():
@@ -254,20 +396,13 @@ def create_emergency_alert():
 @app.route('/api/activities')
 def get_activities():
     """Get recent activities"""
-    return jsonify(app_data['activities'])
+    refresh_if_stale('activities')
+    return _conditional_json('activities')
 
 @app.route('/api/system/health')
 def get_system_health():
     """Get system health status"""
-    health = {
-        "Drone Fleet": "OK",
-        "GPS Tracking": "OK", 
-        "Communication": "OK",
-        "Medical Inventory": "OK",
-        "Weather Service": "OK",
-        "Database": "OK"
-    }
-    return jsonify(health)
+    return Response(_HEALTH_BYTES, mimetype='application/json')
 
 @app.route('/api/mission/stats')
 def get_mission_stats():
@@ -278,11 +413,11 @@ def get_mission_stats():
 # Error handlers
 @app.errorhandler(404)
 def not_found(error):
-    return jsonify({'error': 'Endpoint not found'}), 404
+    return Response(_NOT_FOUND_BYTES, status=404, mimetype='application/json')
 
 @app.errorhandler(500)
 def internal_error(error):
-    return jsonify({'error': 'Internal server error'}), 500
+    return Response(_INTERNAL_ERROR_BYTES, status=500, mimetype='application/json')
 
 if __name__ == '__main__':
     # Initialize data
@@ -293,6 +428,7 @@ if __name__ == '__main__':
     print("🚁 VTOL Medical Drone System Server Starting...")
     print(f"📡 API Endpoints available at http://localhost:{PORT}/api/")
     print(f"🌐 Web Interface available at http://localhost:{PORT}/")
-    print("🔧 Real-time updates enabled")
+    print("🔧 Real-time updates refreshed on demand")
     
-    app.run(debug=True, host='0.0.0.0', port=PORT)
+    # Debug mode and the reloader add per-request overhead and a second process
+    app.run(debug=False, use_reloader=False, threaded=True, host='0.0.0.0', port=PORT)
@@ -4,6 +4,7 @@ VTOL Medical Drone System - Server Startup Script
 Easy way to start the Flask server with proper configuration
 """
 
+import importlib.util
 import os
 import sys
 import subprocess
@@ -11,19 +12,18 @@ import webbrowser
 import time
 from pathlib import Path
 
+REQUIRED_MODULES = ('flask', 'flask_compress', 'orjson', 'pandas', 'numpy')
+
 def check_dependencies():
     """Check if required dependencies are installed"""
-    try:
-        import flask
-        import flask_cors
-        import pandas
-        import numpy
-        print("✅ All dependencies are installed")
-        return True
-    except ImportError as e:
-        print(f"❌ Missing dependency: {e}")
-        print("Please install dependencies with: pip install -r requirements.txt")
-        return False
+    # Locate modules without importing them; the server imports them once for real
+    for module in REQUIRED_MODULES:
+        if importlib.util.find_spec(module) is None:
+            print(f"❌ Missing dependency: No module named '{module}'")
+            print("Please install dependencies with: pip install -r requirements.txt")
+            return False
+    print("✅ All dependencies are installed")
+    return True
 
 def start_server():
     """Start the Flask server"""
@@ -41,7 +41,7 @@ def start_server():
     print(f"📁 Working directory: {script_dir}")
     print("🌐 Starting Flask server on http://localhost:8080")
     print("📡 API endpoints available at http://localhost:8080/api/")
-    print("🔧 Real-time updates enabled")
+    print("🔧 Real-time updates refreshed on demand")
     print("=" * 60)
     
     try:
@@ -58,8 +58,13 @@ def start_server():
         browser_thread.daemon = True
         browser_thread.start()
         
-        # Start the server
-        app.run(debug=True, host='0.0.0.0', port=8080)
+        # Start the server, preferring the production WSGI server when installed
+        try:
+            from waitress import serve
+        except ImportError:
+            app.run(debug=False, use_reloader=False, threaded=True, host='0.0.0.0', port=8080)
+        else:
+            serve(app, host='0.0.0.0', port=8080, threads=8)
         
     except KeyboardInterrupt:
         print("\n🛑 Server stopped by user")
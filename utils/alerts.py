@@ -3,20 +3,50 @@ Advanced Alert Management System
 Real-time monitoring and notification system for VTOL medical drone operations
 """
 
-import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-import random
-import json
+import heapq
+import itertools
+import time
+from collections import deque
 from typing import Dict, List, Optional
 
+from utils.alerts_numeric import (
+    SEVERITY_CODES, SEVERITY_SCORES, TYPE_CODES, TYPE_MULTIPLIERS,
+    encode_alert_types, encode_severities, priority_scores
+)
+
+# Per-tick firing probabilities: battery, medical supply, weather, system health
+EVENT_PROBABILITIES = np.array([0.08, 0.05, 0.03, 0.02])
+
+# Columnar alert store: one array per hot field, indexed by alert row
+ALERT_COLUMNS = {
+    'severity_code': np.int8,
+    'type_code': np.int8,
+    'priority_score': np.int32,
+    'ts_epoch': np.float64,
+    'resolved_ts_epoch': np.float64,
+    'resolved': np.bool_
+}
+INITIAL_ALERT_CAPACITY = 256
+
 class AlertManager:
     """Comprehensive alert management system"""
 
-    def __init__(self):
-        self.active_alerts = []
+    def __init__(self, seed=None):
+        self._rng = np.random.default_rng(seed)
+        self._alerts = []  # Alert dicts by row; hot fields are mirrored in self._columns
+        self._row_by_id = {}
+        self._id_counter = itertools.count(1)  # next() is atomic under the GIL
+        self._columns = {name: np.zeros(INITIAL_ALERT_CAPACITY, dtype=dtype)
+                         for name, dtype in ALERT_COLUMNS.items()}
+        self._severity_names = list(SEVERITY_CODES)
+        self._severity_codes = dict(SEVERITY_CODES)
+        self._type_names = list(TYPE_CODES)
+        self._type_codes = dict(TYPE_CODES)
         self.alert_history = []
-        self.recent_activities = []
+        self.version = 0  # Bumped whenever alerts or activities change
+        self.recent_activities = deque(maxlen=100)  # Keep last 100 activities
         self.alert_thresholds = {
             'battery_critical': 15,
             'battery_low': 25,
@@ -28,14 +58,16 @@ class AlertManager:
     def create_alert(self, alert_type: str, severity: str, title: str, message: str, 
                     source: str = "System", metadata: Optional[Dict] = None):
         """Create a new alert with comprehensive details"""
+        ts_epoch = time.time()
         alert = {
-            'id': f"ALT-{len(self.active_alerts) + len(self.alert_history) + 1:06d}",
+            'id': f"ALT-{next(self._id_counter):06d}",
             'type': alert_type,
             'severity': severity,
             'title': title,
             'message': message,
             'source': source,
-            'timestamp': datetime.now(),
+            'timestamp': datetime.fromtimestamp(ts_epoch),
+            'ts_epoch': ts_epoch,
             'location': metadata.get('location', 'System') if metadata else 'System',
             'acknowledged': False,
             'resolved': False,
@@ -43,31 +75,96 @@ class AlertManager:
             'priority_score': self._calculate_priority_score(severity, alert_type)
         }
 
-        self.active_alerts.append(alert)
+        self._append_row(alert)
+        self.version += 1
         self._log_activity(f"Alert created: {title}", "alert")
         return alert
 
+    @staticmethod
+    def _register_code(names, codes, value):
+        """Map a name to its categorical code, registering unseen names"""
+        code = codes.get(value)
+        if code is None:
+            code = len(names)
+            names.append(value)
+            codes[value] = code
+        return code
+
+    def _append_row(self, alert: Dict):
+        """Store an alert and mirror its hot fields into the column arrays"""
+        row = len(self._alerts)
+        if row == len(self._columns['ts_epoch']):
+            # Double capacity so appends stay amortized O(1)
+            self._columns = {name: np.concatenate([col, np.zeros_like(col)])
+                             for name, col in self._columns.items()}
+
+        columns = self._columns
+        columns['severity_code'][row] = self._register_code(self._severity_names, self._severity_codes, alert['severity'])
+        columns['type_code'][row] = self._register_code(self._type_names, self._type_codes, alert['type'])
+        columns['priority_score'][row] = alert['priority_score']
+        columns['ts_epoch'][row] = alert['ts_epoch']
+        columns['resolved'][row] = False
+        self._alerts.append(alert)
+        self._row_by_id[alert['id']] = row
+
+    def _active_row(self, alert_id: str) -> Optional[int]:
+        """Row of an unresolved alert, or None"""
+        row = self._row_by_id.get(alert_id)
+        if row is None or self._columns['resolved'][row]:
+            return None
+        return row
+
+    def _active_rows(self) -> np.ndarray:
+        """Rows of unresolved alerts, in creation order"""
+        return np.flatnonzero(~self._columns['resolved'][:len(self._alerts)])
+
+    def _rank_rows(self, rows: np.ndarray, limit: Optional[int] = None) -> np.ndarray:
+        """Order rows by priority score then recency, keeping only the top ``limit``"""
+        priority = self._columns['priority_score'][rows]
+        ts_epoch = self._columns['ts_epoch'][rows]
+
+        if limit is not None and limit < len(rows):
+            if limit <= 0:
+                return rows[:0]
+            # O(N) selection of the top ``limit`` before sorting: everything above the
+            # limit-th largest score, then the most recent of the rows tied at that score
+            threshold = np.partition(priority, len(rows) - limit)[len(rows) - limit]
+            above = np.flatnonzero(priority > threshold)
+            tied = np.flatnonzero(priority == threshold)
+            needed = limit - len(above)
+            if needed < len(tied):
+                # Same selection on recency; exact timestamp ties go to the older rows
+                tied_ts = ts_epoch[tied]
+                ts_threshold = np.partition(tied_ts, len(tied) - needed)[len(tied) - needed]
+                newer = tied[tied_ts > ts_threshold]
+                same = tied[tied_ts == ts_threshold]
+                tied = np.concatenate([newer, same[:needed - len(newer)]])
+            keep = np.sort(np.concatenate([above, tied]))  # Back in creation order for stable ties
+            rows, priority, ts_epoch = rows[keep], priority[keep], ts_epoch[keep]
+
+        # lexsort is stable and keys are in ascending priority; ties keep creation order
+        return rows[np.lexsort((-ts_epoch, -priority))]
+
     def _calculate_priority_score(self, severity: str, alert_type: str) -> int:
         """Calculate priority score for alert ordering"""
-        severity_scores = {'critical': 100, 'warning': 50, 'info': 20, 'success': 10}
-        type_multipliers = {
-            'drone_battery': 1.5,
-            'medical_supply': 1.3,
-            'system_error': 1.4,
-            'weather': 1.1,
-            'maintenance': 1.0
-        }
-
-        base_score = severity_scores.get(severity, 0)
-        multiplier = type_multipliers.get(alert_type, 1.0)
+        base_score = SEVERITY_SCORES.get(severity, 0)
+        multiplier = TYPE_MULTIPLIERS.get(alert_type, 1.0)
         return int(base_score * multiplier)
 
-    def get_active_alerts(self, limit: int = 50) -> List[Dict]:
-        """Get active alerts sorted by priority and time"""
-        active = [alert for alert in self.active_alerts if not alert['resolved']]
-        # Sort by priority score (desc) then timestamp (desc)
-        active.sort(key=lambda x: (x['priority_score'], x['timestamp']), reverse=True)
-        return active[:limit]
+    def rescore_alerts(self, alerts: List[Dict]) -> List[Dict]:
+        """Recalculate priority scores in bulk, e.g. for alerts replayed from storage"""
+        scores = priority_scores(
+            encode_severities(a['severity'] for a in alerts),
+            encode_alert_types(a['type'] for a in alerts)
+        )
+        for alert, score in zip(alerts, scores.tolist()):
+            alert['priority_score'] = score
+        return alerts
+
+    def get_active_alerts(self, limit: Optional[int] = 50) -> List[Dict]:
+        """Get active alerts sorted by priority and time; ``limit=None`` returns all"""
+        alerts = self._alerts
+        return [alerts[row] for row in self._rank_rows(self._active_rows(), limit).tolist()]
 
     def create_emergency_alert(self):
         """Create emergency protocol alert"""
@@ -82,13 +179,20 @@ class AlertManager:
 
     def simulate_real_time_alerts(self):
         """Generate realistic alerts based on operational scenarios"""
+        battery_fires, supply_fires, weather_fires, system_fires = (
+            self._rng.random(len(EVENT_PROBABILITIES)) < EVENT_PROBABILITIES
+        ).tolist()
+        if not (battery_fires or supply_fires or weather_fires or system_fires):
+            return
+        integers, create_alert = self._rng.integers, self.create_alert
+
         # Battery alerts
-        if random.random() < 0.08:  # 8% chance
-            drone_id = f"LLA-{random.randint(1, 15):03d}"
-            battery_level = random.randint(5, 20)
+        if battery_fires:  # 8% chance
+            drone_id = f"LLA-{integers(1, 16):03d}"
+            battery_level = int(integers(5, 21))
             severity = "critical" if battery_level <= 15 else "warning"
 
-            self.create_alert(
+            create_alert(
                 "drone_battery",
                 severity,
                 f"{'Critical' if severity == 'critical' else 'Low'} Battery Alert",
@@ -98,12 +202,12 @@ class AlertManager:
             )
 
         # Medical supply alerts
-        if random.random() < 0.05:  # 5% chance
+        if supply_fires:  # 5% chance
             supplies = ["Blood Pack O+", "Emergency Medications", "IV Fluids", "Trauma Kit"]
-            item = random.choice(supplies)
-            stock_level = random.randint(1, 8)
+            item = supplies[integers(len(supplies))]
+            stock_level = int(integers(1, 9))
 
-            self.create_alert(
+            create_alert(
                 "medical_supply",
                 "warning",
                 f"Low Stock Alert - {item}",
@@ -113,11 +217,11 @@ class AlertManager:
             )
 
         # Weather alerts
-        if random.random() < 0.03:  # 3% chance
+        if weather_fires:  # 3% chance
             weather_conditions = ["High winds (25+ km/h)", "Heavy precipitation", "Low visibility", "Thunderstorm approaching"]
-            condition = random.choice(weather_conditions)
+            condition = weather_conditions[integers(len(weather_conditions))]
 
-            self.create_alert(
+            create_alert(
                 "weather",
                 "warning",
                 "Weather Advisory",
@@ -127,15 +231,15 @@ class AlertManager:
             )
 
         # System health alerts
-        if random.random() < 0.02:  # 2% chance
+        if system_fires:  # 2% chance
             system_issues = [
                 ("Communication", "Intermittent GPS signal loss detected"),
                 ("Temperature", "Cold storage unit temperature fluctuation"),
                 ("Network", "Reduced network connectivity in Zone Beta")
             ]
-            system, issue = random.choice(system_issues)
+            system, issue = system_issues[integers(len(system_issues))]
 
-            self.create_alert(
+            create_alert(
                 "system_health",
                 "info",
                 f"{system} Status Update",
@@ -154,10 +258,7 @@ class AlertManager:
         }
 
         self.recent_activities.append(activity)
-
-        # Keep last 100 activities
-        if len(self.recent_activities) > 100:
-            self.recent_activities = self.recent_activities[-100:]
+        self.version += 1
 
     def get_recent_activities(self, limit: int = 20) -> List[Dict]:
         """Get recent system activities"""
@@ -174,96 +275,111 @@ class AlertManager:
                 ("Temperature monitoring systems active", "system")
             ]
 
-            for i, (desc, activity_type) in enumerate(initial_activities):
-                self.recent_activities.append({
-                    'timestamp': datetime.now() - timedelta(minutes=i*5),
-                    'type': activity_type,
-                    'description': desc,
-                    'user': 'System'
-                })
+            now = datetime.now()
+            self.recent_activities.extend({
+                'timestamp': now - timedelta(minutes=i*5),
+                'type': activity_type,
+                'description': desc,
+                'user': 'System'
+            } for i, (desc, activity_type) in enumerate(initial_activities))
+            self.version += 1
 
-        return sorted(self.recent_activities, key=lambda x: x['timestamp'], reverse=True)[:limit]
+        return heapq.nlargest(limit, self.recent_activities, key=lambda x: x['timestamp'])
 
     def get_alert_statistics(self) -> Dict:
         """Get comprehensive alert statistics"""
-        active = self.get_active_alerts()
+        n = len(self._alerts)
+        columns = self._columns
+        active = ~columns['resolved'][:n]
 
         # Severity breakdown
         severity_counts = {'critical': 0, 'warning': 0, 'info': 0, 'success': 0}
-        for alert in active:
-            severity_counts[alert['severity']] += 1
+        counts = np.bincount(columns['severity_code'][:n][active], minlength=len(self._severity_names))
+        severity_counts.update({name: count for name, count in zip(self._severity_names, counts.tolist()) if count})
 
         # Type breakdown
-        type_counts = {}
-        for alert in active:
-            alert_type = alert['type']
-            type_counts[alert_type] = type_counts.get(alert_type, 0) + 1
+        counts = np.bincount(columns['type_code'][:n][active], minlength=len(self._type_names))
+        type_counts = {name: count for name, count in zip(self._type_names, counts.tolist()) if count}
 
         # Time-based analysis
-        recent_alerts = [a for a in active if (datetime.now() - a['timestamp']).total_seconds() < 3600]  # Last hour
+        now_ts = time.time()
+        recent_alerts = active & (now_ts - columns['ts_epoch'][:n] < 3600)  # Last hour
 
         return {
-            'total_active': len(active),
-            'total_resolved_today': len([a for a in self.alert_history 
-                                       if a.get('resolved_at', datetime.min).date() == datetime.now().date()]),
+            'total_active': int(np.count_nonzero(active)),
+            'total_resolved_today': int(np.count_nonzero(self._resolved_today_mask())),
             'severity_breakdown': severity_counts,
             'type_breakdown': type_counts,
-            'recent_alerts_1h': len(recent_alerts),
+            'recent_alerts_1h': int(np.count_nonzero(recent_alerts)),
             'average_resolution_time': self._calculate_avg_resolution_time()
         }
 
+    def _resolved_today_mask(self) -> np.ndarray:
+        """Mask of alert rows that were resolved since local midnight"""
+        n = len(self._alerts)
+        midnight_ts = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0).timestamp()
+        return self._columns['resolved'][:n] & (self._columns['resolved_ts_epoch'][:n] >= midnight_ts)
+
     def _calculate_avg_resolution_time(self) -> float:
         """Calculate average alert resolution time in minutes"""
-        resolved_today = [a for a in self.alert_history 
-                         if a.get('resolved_at', datetime.min).date() == datetime.now().date()]
+        resolved_today = self._resolved_today_mask()
 
-        if not resolved_today:
+        if not resolved_today.any():
             return 0.0
 
-        total_time = sum(
-            (a['resolved_at'] - a['timestamp']).total_seconds() / 60 
-            for a in resolved_today 
-            if 'resolved_at' in a
-        )
+        n = len(self._alerts)
+        durations = self._columns['resolved_ts_epoch'][:n][resolved_today] - self._columns['ts_epoch'][:n][resolved_today]
 
-        return round(total_time / len(resolved_today), 1)
+        return round(float(durations.mean()) / 60, 1)
 
     def acknowledge_alert(self, alert_id: str, user: str = "System") -> bool:
         """Acknowledge an alert"""
-        for alert in self.active_alerts:
-            if alert['id'] == alert_id:
-                alert['acknowledged'] = True
-                alert['acknowledged_by'] = user
-                alert['acknowledged_at'] = datetime.now()
-                self._log_activity(f"Alert {alert_id} acknowledged by {user}", "alert_action")
-                return True
-        return False
+        row = self._active_row(alert_id)
+        if row is None:
+            return False
+
+        alert = self._alerts[row]
+        alert['acknowledged'] = True
+        alert['acknowledged_by'] = user
+        alert['acknowledged_at'] = datetime.now()
+        self.version += 1
+        self._log_activity(f"Alert {alert_id} acknowledged by {user}", "alert_action")
+        return True
 
     def resolve_alert(self, alert_id: str, user: str = "System", notes: str = "") -> bool:
         """Resolve an alert and move to history"""
-        for i, alert in enumerate(self.active_alerts):
-            if alert['id'] == alert_id:
-                alert['resolved'] = True
-                alert['resolved_by'] = user
-                alert['resolved_at'] = datetime.now()
-                alert['resolution_notes'] = notes
-
-                # Move to history
-                self.alert_history.append(alert)
-                self.active_alerts.pop(i)
-
-                self._log_activity(f"Alert {alert_id} resolved by {user}", "alert_action")
-                return True
-        return False
+        row = self._active_row(alert_id)
+        if row is None:
+            return False
+
+        resolved_ts_epoch = time.time()
+        self._columns['resolved'][row] = True
+        self._columns['resolved_ts_epoch'][row] = resolved_ts_epoch
+        alert = self._alerts[row]
+        alert['resolved'] = True
+        alert['resolved_by'] = user
+        alert['resolved_at'] = datetime.fromtimestamp(resolved_ts_epoch)
+        alert['resolved_ts_epoch'] = resolved_ts_epoch
+        alert['resolution_notes'] = notes
+
+        # Move to history
+        self.alert_history.append(alert)
+        self.version += 1
+
+        self._log_activity(f"Alert {alert_id} resolved by {user}", "alert_action")
+        return True
 
     def get_critical_alert_summary(self) -> Dict:
         """Get summary of critical alerts for dashboard"""
-        critical_alerts = [a for a in self.get_active_alerts() if a['severity'] == 'critical']
-        warning_alerts = [a for a in self.get_active_alerts() if a['severity'] == 'warning']
+        rows = self._active_rows()
+        severity_codes = self._columns['severity_code'][rows]
+        critical_rows = rows[severity_codes == SEVERITY_CODES['critical']]
+        critical_count = len(critical_rows)
+        warning_count = int(np.count_nonzero(severity_codes == SEVERITY_CODES['warning']))
 
         return {
-            'critical_count': len(critical_alerts),
-            'warning_count': len(warning_alerts),
-            'latest_critical': critical_alerts[0] if critical_alerts else None,
-            'system_status': 'critical' if critical_alerts else ('warning' if warning_alerts else 'operational')
+            'critical_count': critical_count,
+            'warning_count': warning_count,
+            'latest_critical': self._alerts[self._rank_rows(critical_rows, 1)[0]] if critical_count else None,
+            'system_status': 'critical' if critical_count else ('warning' if warning_count else 'operational')
         }
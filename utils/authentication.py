@@ -5,199 +5,330 @@ Secure user authentication with role-based access control
 
 import hashlib
 import secrets
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+import sys
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+
+# Role names, interned so equal names are the same object and compare by identity first
+_ROLE_ADMIN = sys.intern('Administrator')
+_ROLE_FLEET_MANAGER = sys.intern('Fleet Manager')
+_ROLE_PILOT_OPERATOR = sys.intern('Pilot Operator')
+_ROLE_MEDICAL_COORDINATOR = sys.intern('Medical Coordinator')
+_ROLE_MAINTENANCE_TECH = sys.intern('Maintenance Tech')
+_ROLE_OBSERVER = sys.intern('Observer')
+
+def _permission_set(*permissions: str) -> FrozenSet[str]:
+    """Build a frozenset of interned permission names"""
+    return frozenset(map(sys.intern, permissions))
+
+# Explicit Administrator whitelist; check_permission answers admins from it directly
+_ADMIN_PERMISSIONS = _permission_set(
+    'view_all_data', 'control_all_drones', 'manage_users',
+    'system_configuration', 'emergency_override', 'data_export',
+    'maintenance_management', 'inventory_full_access'
+)
+
+# Permissions by user role; frozensets make membership checks a single hash probe
+_ROLE_PERMISSIONS = {
+    _ROLE_ADMIN: _ADMIN_PERMISSIONS,
+    _ROLE_FLEET_MANAGER: _permission_set(
+        'view_all_data', 'control_all_drones', 'mission_planning',
+        'fleet_analytics', 'maintenance_view', 'inventory_management'
+    ),
+    _ROLE_PILOT_OPERATOR: _permission_set(
+        'view_fleet_data', 'control_assigned_drones', 'mission_execution',
+        'flight_planning', 'emergency_procedures'
+    ),
+    _ROLE_MEDICAL_COORDINATOR: _permission_set(
+        'view_medical_data', 'inventory_management', 'delivery_tracking',
+        'supply_analytics', 'temperature_monitoring'
+    ),
+    _ROLE_MAINTENANCE_TECH: _permission_set(
+        'view_maintenance_data', 'maintenance_management', 'component_tracking',
+        'diagnostic_tools', 'repair_logging'
+    ),
+    _ROLE_OBSERVER: _permission_set(
+        'view_basic_data', 'mission_tracking', 'status_monitoring'
+    )
+}
+_DEFAULT_PERMISSIONS = _permission_set('view_basic_data')
+
+class PermissionTrie:
+    """Prefix tree over permission names split into '_'-separated segments"""
+
+    __slots__ = ('children', 'terminal')
+
+    def __init__(self, permissions: Iterable[str] = ()):
+        self.children: Dict[str, 'PermissionTrie'] = {}
+        self.terminal = False
+        for permission in permissions:
+            self.add(permission)
+
+    def add(self, permission: str):
+        """Insert a permission name"""
+        node = self
+        for segment in permission.split('_'):
+            child = node.children.get(segment)
+            if child is None:
+                child = node.children[segment] = PermissionTrie()
+            node = child
+        node.terminal = True
+
+    def matches(self, pattern: str) -> bool:
+        """Check a pattern; '*' matches one segment, or any remainder when it is last"""
+        return self._matches(pattern.split('_'), 0)
+
+    def _matches(self, segments: List[str], i: int) -> bool:
+        if i == len(segments):
+            return self.terminal
+        segment = segments[i]
+        if segment == '*':
+            if i == len(segments) - 1:
+                return bool(self.children)  # Every leaf is terminal
+            return any(child._matches(segments, i + 1) for child in self.children.values())
+        child = self.children.get(segment)
+        return child is not None and child._matches(segments, i + 1)
+
+# One trie per role for wildcard checks such as 'view_*' or 'control_*_drones'
+_ROLE_PERMISSION_TRIES = {role: PermissionTrie(permissions) for role, permissions in _ROLE_PERMISSIONS.items()}
+_DEFAULT_PERMISSION_TRIE = PermissionTrie(_DEFAULT_PERMISSIONS)
+
+def _role_allows(role: str, permission: str) -> bool:
+    """Check a permission name or wildcard pattern against a role"""
+    if '*' in permission:
+        return _ROLE_PERMISSION_TRIES.get(role, _DEFAULT_PERMISSION_TRIE).matches(permission)
+    return permission in _ROLE_PERMISSIONS.get(role, _DEFAULT_PERMISSIONS)
+
+# Memoized check_permission results keyed by (role, permission); valid because the role tables are fixed at import
+_PERMISSION_CACHE: Dict[Tuple[str, str], bool] = {}
 
 class User:
     """User model with role-based permissions"""
 
-    def __init__(self, username: str, email: str, role: str, full_name: str = ""):
+    __slots__ = ('username', 'email', 'role', 'full_name', 'created_at', 'last_login',
+                 'is_active', 'permissions', 'login_count', '_role_info')
+
+    def __init__(self, username: str, email: str, role: str, full_name: Optional[str] = None):
         self.username = username
         self.email = email
-        self.role = role
-        self.full_name = full_name or username.title()
-        self.created_at = datetime.now()
+        self.role = sys.intern(role)
+        self.full_name = full_name if full_name is not None else username.title()
+        self.created_at = None  # Stamped with the first login's UTC clock reading
         self.last_login = None
         self.is_active = True
-        self.permissions = self._get_role_permissions(role)
+        self._role_info = self._get_role_info(self.role)
+        self.permissions = self._role_info.permissions
         self.login_count = 0
 
-    def _get_role_permissions(self, role: str) -> List[str]:
-        """Define permissions based on user role"""
-        role_permissions = {
-            'Administrator': [
-                'view_all_data', 'control_all_drones', 'manage_users', 
-                'system_configuration', 'emergency_override', 'data_export',
-                'maintenance_management', 'inventory_full_access'
-            ],
-            'Fleet Manager': [
-                'view_all_data', 'control_all_drones', 'mission_planning',
-                'fleet_analytics', 'maintenance_view', 'inventory_management'
-            ],
-            'Pilot Operator': [
-                'view_fleet_data', 'control_assigned_drones', 'mission_execution',
-                'flight_planning', 'emergency_procedures'
-            ],
-            'Medical Coordinator': [
-                'view_medical_data', 'inventory_management', 'delivery_tracking',
-                'supply_analytics', 'temperature_monitoring'
-            ],
-            'Maintenance Tech': [
-                'view_maintenance_data', 'maintenance_management', 'component_tracking',
-                'diagnostic_tools', 'repair_logging'
-            ],
-            'Observer': [
-                'view_basic_data', 'mission_tracking', 'status_monitoring'
-            ]
-        }
-        return role_permissions.get(role, ['view_basic_data'])
+    def _get_role_info(self, role: str) -> '_RoleInfo':
+        """Resolve permissions and dashboard layout for a role in one lookup"""
+        return _ROLE_TABLE.get(role, _DEFAULT_ROLE_INFO)
 
     def has_permission(self, permission: str) -> bool:
-        """Check if user has specific permission"""
+        """Check if user has specific permission; wildcard patterns like 'view_*' are accepted"""
+        if '*' in permission:
+            return _ROLE_PERMISSION_TRIES.get(self.role, _DEFAULT_PERMISSION_TRIE).matches(permission)
         return permission in self.permissions
 
     def update_last_login(self):
-        """Update last login timestamp"""
-        self.last_login = datetime.now()
+        """Update last login timestamp (UTC; skips the local timezone conversion)"""
+        now = datetime.now(timezone.utc)
+        if self.created_at is None:
+            self.created_at = now
+        self.last_login = now
         self.login_count += 1
 
+class _UserRecord(NamedTuple):
+    """Stored credentials and profile for one demo user"""
+    password_hash: bytes
+    email: str
+    role: str
+    full_name: str
+
+# Demo user database with enhanced profiles; passwords are stored as raw SHA-256 digests
+_DEMO_USERS = {
+    'admin': _UserRecord(
+        password_hash=bytes.fromhex('240be518fabd2724ddb6f04eeb1da5967448d7e831c08c8fa822809f74c720a9'),
+        email='admin@lifeline-air.com',
+        role='Administrator',
+        full_name='System Administrator'
+    ),
+    'fleet_mgr': _UserRecord(
+        password_hash=bytes.fromhex('5839d8551a5a9416aa2912b8d2b10b3eda4493b7c6c62402ce04a30334e14a6a'),
+        email='fleet@lifeline-air.com',
+        role='Fleet Manager',
+        full_name='Fleet Operations Manager'
+    ),
+    'pilot1': _UserRecord(
+        password_hash=bytes.fromhex('fed8d70279c2a3f6e9afdb9f8eb379b0fdff4f04d076e76beec128dacaf487af'),
+        email='pilot1@lifeline-air.com',
+        role='Pilot Operator',
+        full_name='Senior Drone Pilot'
+    ),
+    'medical': _UserRecord(
+        password_hash=bytes.fromhex('845271951f36aea7a4f5e58859177e0c9d4f501431c25945eac7da26b0be19b6'),
+        email='medical@lifeline-air.com',
+        role='Medical Coordinator',
+        full_name='Medical Supply Coordinator'
+    ),
+    'tech': _UserRecord(
+        password_hash=bytes.fromhex('3ac40463b419a7de590185c7121f0bfbe411d6168699e8014f521b050b1d6653'),
+        email='tech@lifeline-air.com',
+        role='Maintenance Tech',
+        full_name='Senior Maintenance Technician'
+    ),
+    'observer': _UserRecord(
+        password_hash=bytes.fromhex('35853a8d8483bd004611a62712da46409114afdbfa7f63e335d176d93aecdbe1'),
+        email='observer@lifeline-air.com',
+        role='Observer',
+        full_name='Operations Observer'
+    ),
+    'demo': _UserRecord(
+        password_hash=bytes.fromhex('d3ad9315b7be5dd53b31a273b3b3aba5defe700808305aa16a3062b76658a791'),
+        email='demo@lifeline-air.com',
+        role='Observer',
+        full_name='Demo User'
+    )
+}
+
 def authenticate_user(username: str, password: str) -> Tuple[bool, Optional[User]]:
     """
     Authenticate user with enhanced security features
     Returns (success, user_object)
     """
+    record = _DEMO_USERS.get(username)
+    if record is None or not isinstance(password, str):
+        return False, None
 
-    # Demo user database with enhanced profiles
-    demo_users = {
-        'admin': {
-            'password': 'admin123',
-            'email': 'admin@lifeline-air.com',
-            'role': 'Administrator',
-            'full_name': 'System Administrator'
-        },
-        'fleet_mgr': {
-            'password': 'fleet123',
-            'email': 'fleet@lifeline-air.com', 
-            'role': 'Fleet Manager',
-            'full_name': 'Fleet Operations Manager'
-        },
-        'pilot1': {
-            'password': 'pilot123',
-            'email': 'pilot1@lifeline-air.com',
-            'role': 'Pilot Operator', 
-            'full_name': 'Senior Drone Pilot'
-        },
-        'medical': {
-            'password': 'medical123',
-            'email': 'medical@lifeline-air.com',
-            'role': 'Medical Coordinator',
-            'full_name': 'Medical Supply Coordinator'
-        },
-        'tech': {
-            'password': 'tech123',
-            'email': 'tech@lifeline-air.com',
-            'role': 'Maintenance Tech',
-            'full_name': 'Senior Maintenance Technician'
-        },
-        'observer': {
-            'password': 'observer123',
-            'email': 'observer@lifeline-air.com',
-            'role': 'Observer',
-            'full_name': 'Operations Observer'
-        },
-        'demo': {
-            'password': 'demo123',
-            'email': 'demo@lifeline-air.com',
-            'role': 'Observer',
-            'full_name': 'Demo User'
-        }
-    }
-
-    if username in demo_users and demo_users[username]['password'] == password:
-        user_data = demo_users[username]
+    # Constant-time compare of fixed-size digests
+    password_hash = hashlib.sha256(password.encode()).digest()
+    if secrets.compare_digest(record.password_hash, password_hash):
         user = User(
             username=username,
-            email=user_data['email'], 
-            role=user_data['role'],
-            full_name=user_data['full_name']
+            email=record.email,
+            role=record.role,
+            full_name=record.full_name
         )
         user.update_last_login()
         return True, user
 
     return False, None
 
-def get_user_dashboard_config(user: User) -> Dict:
-    """Get personalized dashboard configuration based on user role"""
+# Dashboard layouts by role, shared across calls; tuples keep them immutable
+_BASE_DASHBOARD_CONFIG = {
+    'sidebar_sections': ('System Status',),
+    'main_metrics': ('Active Drones', 'System Health'),
+    'available_pages': ('Fleet Dashboard',),
+    'quick_actions': ('Refresh Data',)
+}
 
-    base_config = {
-        'sidebar_sections': ['System Status'],
-        'main_metrics': ['Active Drones', 'System Health'],
-        'available_pages': ['Fleet Dashboard'],
-        'quick_actions': ['Refresh Data']
+_ROLE_DASHBOARD_CONFIGS = {
+    _ROLE_ADMIN: {
+        'sidebar_sections': ('System Status', 'Quick Actions', 'Admin Tools'),
+        'main_metrics': ('Active Drones', 'Missions Today', 'Medical Supplies', 'System Health'),
+        'available_pages': ('Fleet Dashboard', 'Mission Analytics', 'Flight Tracking',
+                            'Medical Cargo', 'Maintenance', 'Settings'),
+        'quick_actions': ('Emergency Protocol', 'System Backup', 'Generate Report', 'User Management')
+    },
+    _ROLE_FLEET_MANAGER: {
+        'sidebar_sections': ('System Status', 'Fleet Control', 'Analytics'),
+        'main_metrics': ('Active Drones', 'Missions Today', 'Fleet Efficiency', 'Mission Success Rate'),
+        'available_pages': ('Fleet Dashboard', 'Mission Analytics', 'Flight Tracking', 'Maintenance'),
+        'quick_actions': ('Deploy Emergency Mission', 'Recall All Drones', 'Fleet Report')
+    },
+    _ROLE_PILOT_OPERATOR: {
+        'sidebar_sections': ('My Missions', 'Flight Control', 'Weather'),
+        'main_metrics': ('My Active Drones', 'Current Missions', 'Battery Status', 'Weather Status'),
+        'available_pages': ('Fleet Dashboard', 'Flight Tracking'),
+        'quick_actions': ('Emergency Landing', 'Request Support', 'Weather Update')
+    },
+    _ROLE_MEDICAL_COORDINATOR: {
+        'sidebar_sections': ('Medical Inventory', 'Deliveries', 'Alerts'),
+        'main_metrics': ('Medical Supplies', 'Active Deliveries', 'Critical Stock', 'Temperature Status'),
+        'available_pages': ('Medical Cargo', 'Mission Analytics'),
+        'quick_actions': ('Emergency Restock', 'Delivery Status', 'Temperature Alert')
+    },
+    _ROLE_MAINTENANCE_TECH: {
+        'sidebar_sections': ('Maintenance Queue', 'Components', 'Diagnostics'),
+        'main_metrics': ('Maintenance Due', 'Component Health', 'Fleet Availability', 'Repair Queue'),
+        'available_pages': ('Maintenance', 'Fleet Dashboard'),
+        'quick_actions': ('Schedule Maintenance', 'Component Check', 'Diagnostics Report')
     }
+}
 
-    role_configs = {
-        'Administrator': {
-            'sidebar_sections': ['System Status', 'Quick Actions', 'Admin Tools'],
-            'main_metrics': ['Active Drones', 'Missions Today', 'Medical Supplies', 'System Health'],
-            'available_pages': ['Fleet Dashboard', 'Mission Analytics', 'Flight Tracking', 
-                              'Medical Cargo', 'Maintenance', 'Settings'],
-            'quick_actions': ['Emergency Protocol', 'System Backup', 'Generate Report', 'User Management']
-        },
-        'Fleet Manager': {
-            'sidebar_sections': ['System Status', 'Fleet Control', 'Analytics'],
-            'main_metrics': ['Active Drones', 'Missions Today', 'Fleet Efficiency', 'Mission Success Rate'],
-            'available_pages': ['Fleet Dashboard', 'Mission Analytics', 'Flight Tracking', 'Maintenance'],
-            'quick_actions': ['Deploy Emergency Mission', 'Recall All Drones', 'Fleet Report']
-        },
-        'Pilot Operator': {
-            'sidebar_sections': ['My Missions', 'Flight Control', 'Weather'],
-            'main_metrics': ['My Active Drones', 'Current Missions', 'Battery Status', 'Weather Status'],
-            'available_pages': ['Fleet Dashboard', 'Flight Tracking'],
-            'quick_actions': ['Emergency Landing', 'Request Support', 'Weather Update']
-        },
-        'Medical Coordinator': {
-            'sidebar_sections': ['Medical Inventory', 'Deliveries', 'Alerts'],
-            'main_metrics': ['Medical Supplies', 'Active Deliveries', 'Critical Stock', 'Temperature Status'],
-            'available_pages': ['Medical Cargo', 'Mission Analytics'],
-            'quick_actions': ['Emergency Restock', 'Delivery Status', 'Temperature Alert']
-        },
-        'Maintenance Tech': {
-            'sidebar_sections': ['Maintenance Queue', 'Components', 'Diagnostics'],
-            'main_metrics': ['Maintenance Due', 'Component Health', 'Fleet Availability', 'Repair Queue'],
-            'available_pages': ['Maintenance', 'Fleet Dashboard'],
-            'quick_actions': ['Schedule Maintenance', 'Component Check', 'Diagnostics Report']
-        }
-    }
+class _RoleInfo(NamedTuple):
+    """Everything derived from a role, resolved once per User"""
+    permissions: FrozenSet[str]
+    dashboard: Mapping[str, tuple]
 
-    config = role_configs.get(user.role, base_config)
-    config['user_info'] = {
-        'username': user.username,
-        'full_name': user.full_name,
-        'role': user.role,
-        'last_login': user.last_login,
-        'permissions_count': len(user.permissions)
-    }
+# Fused per-role table so a session resolves its role with a single dict probe
+_ROLE_TABLE = {
+    role: _RoleInfo(
+        permissions=_ROLE_PERMISSIONS.get(role, _DEFAULT_PERMISSIONS),
+        dashboard=MappingProxyType(_ROLE_DASHBOARD_CONFIGS.get(role, _BASE_DASHBOARD_CONFIG))
+    )
+    for role in _ROLE_PERMISSIONS.keys() | _ROLE_DASHBOARD_CONFIGS.keys()
+}
+_DEFAULT_ROLE_INFO = _RoleInfo(_DEFAULT_PERMISSIONS, MappingProxyType(_BASE_DASHBOARD_CONFIG))
 
-    return config
+def get_user_dashboard_config(user: User) -> Mapping:
+    """Get personalized dashboard configuration based on user role, as a read-only view"""
+    return MappingProxyType({
+        **user._role_info.dashboard,
+        'user_info': {
+            'username': user.username,
+            'full_name': user.full_name,
+            'role': user.role,
+            'last_login': user.last_login,
+            'permissions_count': len(user.permissions)
+        }
+    })
 
 def check_permission(user: Optional[User], required_permission: str) -> bool:
     """Check if user has required permission"""
     if not user:
         return False
-    return user.has_permission(required_permission)
+    if user.role is _ROLE_ADMIN and '*' not in required_permission:
+        return required_permission in _ADMIN_PERMISSIONS
+    key = (user.role, required_permission)
+    allowed = _PERMISSION_CACHE.get(key)
+    if allowed is None:
+        allowed = _role_allows(user.role, required_permission)
+        _PERMISSION_CACHE[key] = allowed
+    return allowed
+
+def check_permissions_bulk(user: Optional[User], required: Iterable[str]) -> Dict[str, bool]:
+    """Check several plain permission names at once, e.g. for rendering a menu"""
+    if not user:
+        return {permission: False for permission in required}
+    granted = user.permissions
+    return {permission: permission in granted for permission in required}
+
+def missing_permissions(user: Optional[User], required: FrozenSet[str]) -> FrozenSet[str]:
+    """Return the required permissions the user lacks, as one set difference"""
+    if not user:
+        return frozenset(required)
+    return required - user.permissions
+
+def clear_permission_cache():
+    """Drop memoized check_permission results; role tables are fixed at import and are not reloaded"""
+    _PERMISSION_CACHE.clear()
+
+# Security context fields that never change; only the scan time is computed per call
+_SECURITY_CONTEXT_STATIC = MappingProxyType({
+    'session_active': True,
+    'threat_level': 'Low',
+    'recommendations': (
+        'Regular password updates recommended',
+        'Enable two-factor authentication',
+        'Review user access permissions quarterly'
+    ),
+    'audit_log_enabled': True,
+    'encryption_status': 'Active'
+})
+_SECURITY_SCAN_AGE = timedelta(hours=2)
 
 def get_security_context() -> Dict:
     """Get current security context and recommendations"""
-    return {
-        'session_active': True,
-        'last_security_scan': datetime.now() - timedelta(hours=2),
-        'threat_level': 'Low',
-        'recommendations': [
-            'Regular password updates recommended',
-            'Enable two-factor authentication',
-            'Review user access permissions quarterly'
-        ],
-        'audit_log_enabled': True,
-        'encryption_status': 'Active'
-    }
+    return {**_SECURITY_CONTEXT_STATIC, 'last_security_scan': datetime.now() - _SECURITY_SCAN_AGE}
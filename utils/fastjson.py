@@ -0,0 +1,59 @@
+"""
+Fast JSON Encoding
+orjson-backed drop-in for the json module's dumps/loads
+"""
+
+import orjson
+import numpy as np
+import pandas as pd
+from decimal import Decimal
+from collections.abc import Mapping
+from typing import Any, Callable, Optional
+
+# NumPy arrays/scalars encode natively; naive datetimes are treated as UTC and get a +00:00 suffix
+OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+
+def encode_default(obj):
+    """Convert types orjson does not handle natively"""
+    if obj is pd.NaT:
+        return None
+    if isinstance(obj, pd.Timestamp):
+        return obj.to_pydatetime()
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, Mapping):  # Read-only views such as MappingProxyType
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _chain_default(default: Optional[Callable]) -> Callable:
+    """Try the built-in conversions first, then the caller's ``default``"""
+    if default is None:
+        return encode_default
+
+    def chained(obj):
+        try:
+            return encode_default(obj)
+        except TypeError:
+            return default(obj)
+    return chained
+
+def dumps_bytes(obj: Any, default: Optional[Callable] = None, indent: Optional[int] = None,
+                sort_keys: bool = False) -> bytes:
+    """Serialize ``obj`` to UTF-8 JSON bytes; any truthy ``indent`` means two spaces"""
+    option = OPTIONS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    return orjson.dumps(obj, default=_chain_default(default), option=option)
+
+def dumps(obj: Any, default: Optional[Callable] = None, indent: Optional[int] = None,
+          sort_keys: bool = False) -> str:
+    """Serialize ``obj`` to a JSON string, like json.dumps"""
+    return dumps_bytes(obj, default=default, indent=indent, sort_keys=sort_keys).decode()
+
+def loads(s) -> Any:
+    """Deserialize JSON from str, bytes or bytearray"""
+    return orjson.loads(s)